@@ -1,8 +1,17 @@
 import numpy as np
 import math
-from typing import Dict, List, Tuple, Optional, Any
+import re
+from itertools import islice
+from typing import Dict, List, Tuple, Optional, Any, FrozenSet, NamedTuple, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
+
+# Optional JIT compilation for numeric kernels
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Import the symbolic system
 from quantum_symbolic_logos import (
@@ -10,6 +19,20 @@ from quantum_symbolic_logos import (
     UnifiedQuantumSymbolicLogos
 )
 
+class _FallbackHebrewGematriaProcessor:
+    """Placeholder used when no HebrewGematriaProcessor is defined"""
+
+# Optional processors, resolved once at import instead of on every instantiation
+try:
+    PseudoarchaeologyProcessor
+except NameError:
+    PseudoarchaeologyProcessor = None
+
+try:
+    HebrewGematriaProcessor
+except NameError:
+    HebrewGematriaProcessor = _FallbackHebrewGematriaProcessor
+
 class ScriptType(Enum):
     LATIN = "Latin"
     CYRILLIC = "Cyrillic"
@@ -21,6 +44,10 @@ class ScriptType(Enum):
     HEBREW = "Hebrew"
     UNKNOWN = "Unknown"
 
+# Magnitude bounds outside which the consciousness field is renormalized to unit length
+_CONSCIOUSNESS_FIELD_MAX = 1e6
+_CONSCIOUSNESS_FIELD_MIN = 1e-6
+
 class LogosResonanceType(Enum):
     SEMANTIC = "semantic"
     PHONETIC = "phonetic"
@@ -30,7 +57,7 @@ class LogosResonanceType(Enum):
     QUANTUM = "quantum"
     SYMBOLIC = "symbolic"  # Added symbolic resonance type
 
-@dataclass
+@dataclass(slots=True)
 class LanguageInfo:
     iso_639_1: str
     iso_639_2: str
@@ -39,6 +66,14 @@ class LanguageInfo:
     rtl: bool = False
     quantum_signature: complex = field(default_factory=lambda: complex(0, 0))
 
+class Sefira(NamedTuple):
+    """A sefira on the Tree of Life"""
+    key: str
+    name: str
+    value: int
+    level: int
+    position: str
+
 @dataclass
 class LogosQuantumState:
     """Represents the quantum state of linguistic meaning"""
@@ -51,6 +86,58 @@ class LogosQuantumState:
     linguistic_entropy: float
     symbolic_state: Optional[SymbolicLogosState] = None  # Added symbolic integration
 
+def _accumulate_resonance(equation_resonances: Sequence[float], pattern_resonances: Sequence[float]) -> complex:
+    """Sum r*e^(i*r*pi) over equation resonances and r*e^(i*r*pi/2) over pattern resonances"""
+    real_component = 0.0
+    imag_component = 0.0
+    for resonance in equation_resonances:
+        real_component += resonance * math.cos(resonance * math.pi)
+        imag_component += resonance * math.sin(resonance * math.pi)
+    for resonance in pattern_resonances:
+        real_component += resonance * math.cos(resonance * math.pi / 2)
+        imag_component += resonance * math.sin(resonance * math.pi / 2)
+    return complex(real_component, imag_component)
+
+def _apply_gates_kernel(qubits: np.ndarray, gate_codes: np.ndarray, indices: np.ndarray):
+    """Apply H (code 0) and Pauli-X (code 1) gates in order; other codes are ignored"""
+    for i in range(indices.shape[0]):
+        qubit_index = indices[i]
+        if gate_codes[i] == 0:
+            qubits[qubit_index] = 0.707 + 0.707j
+        elif gate_codes[i] == 1:
+            amplitude = qubits[qubit_index]
+            qubits[qubit_index] = complex(amplitude.imag, amplitude.real)
+
+if njit is not None:
+    _apply_gates_kernel = njit(cache=True)(_apply_gates_kernel)
+    # Compile at import rather than on the first batch
+    _apply_gates_kernel(np.ones(1, dtype=np.complex128), np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+
+def _decode_codepoints(text: str) -> np.ndarray:
+    """Decode text into a uint32 array of Unicode codepoints (lone surrogates pass through as their own codepoint)"""
+    return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+
+# Static fragments of the logographic meditation text, joined per glyph
+_FOCUS_SEP = ": "
+_EGY_SYSTEM = "Egyptian Hieroglyphs"
+_CHN_SYSTEM = "Chinese Characters"
+_CUN_SYSTEM = "Sumerian Cuneiform"
+_EGY_FOCUS_PFX = "Contemplate the sacred meaning of "
+_EGY_VIS_PFX = "See the hieroglyph "
+_EGY_VIS_SFX = " glowing with golden light on temple walls"
+_CHN_FOCUS_PFX = "Meditate on the essence of "
+_CHN_VIS_PFX = "Visualize the character "
+_CHN_VIS_SFX = " written with flowing brush strokes"
+_CUN_FOCUS_PFX = "Connect with ancient Sumerian wisdom through "
+_CUN_VIS_PFX = "See the cuneiform "
+_CUN_VIS_SFX = " pressed into clay tablets by ancient scribes"
+
+# Breath cycles are clamped to 4..10 counts, so every possible pattern is built once
+_LOGOGRAPHIC_BREATHING = tuple(
+    f"Breathe with the rhythm of ancient wisdom: Inhale for {breath_cycle} counts (absorbing glyph energy), hold for {breath_cycle//2} (integrating meaning), exhale for {breath_cycle} (releasing old patterns)"
+    for breath_cycle in range(4, 11)
+)
+
 class AncientAstronomyProcessor:
     """
     Ancient Astronomy Integration for APO Quantum Logos System
@@ -511,28 +598,16 @@ class AncientAstronomyProcessor:
             }
         }
 
-    def calculate_ancient_astronomical_resonance(self, text: str) -> Dict[str, Any]:
+    def calculate_ancient_astronomical_resonance(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Calculate resonance with ancient astronomical concepts"""
+        if text_lower is None:
+            text_lower = text.lower()
         resonance_scores = {}
         total_resonance = 0
         
         # Check for astronomical symbols and concepts
         for system_name, system_data in self.ancient_astronomy_database.items():
-            resonance = 0
-            
-            # Check for symbols in text
-            if 'symbols' in system_data:
-                for symbol in system_data['symbols']:
-                    if symbol in text:
-                        resonance += 1
-            
-            # Check for civilization names
-            if system_data['civilization'].lower() in text.lower():
-                resonance += 0.5
-            
-            # Check for specific terms
-            if system_name.replace('_', ' ').lower() in text.lower():
-                resonance += 1
+            resonance = self._system_raw_resonance(system_name, system_data, text, text_lower)
             
             if resonance > 0:
                 # Weight by quantum signature
@@ -549,13 +624,13 @@ class AncientAstronomyProcessor:
         # Check constellation systems
         constellation_resonance = 0
         for system_name, system_data in self.constellation_systems.items():
-            if system_name.lower() in text.lower():
+            if system_name.lower() in text_lower:
                 constellation_resonance += abs(system_data['quantum_signature'])
         
         # Check calendar systems
         calendar_resonance = 0
         for calendar_name, calendar_data in self.ancient_calendars.items():
-            if calendar_name.lower().replace('_', ' ') in text.lower():
+            if calendar_name.lower().replace('_', ' ') in text_lower:
                 calendar_resonance += abs(calendar_data['quantum_signature'])
         
         return {
@@ -568,6 +643,37 @@ class AncientAstronomyProcessor:
             'ancient_wisdom_level': min(total_resonance / 10, 1.0)  # Normalized to 0-1
         }
     
+    def _system_raw_resonance(self, system_name: str, system_data: Dict, text: str, text_lower: str) -> float:
+        """Raw (unweighted) resonance of one astronomical system with the text"""
+        resonance = 0
+        
+        # Check for symbols in text
+        if 'symbols' in system_data:
+            for symbol in system_data['symbols']:
+                if symbol in text:
+                    resonance += 1
+        
+        # Check for civilization names
+        if system_data['civilization'].lower() in text_lower:
+            resonance += 0.5
+        
+        # Check for specific terms
+        if system_name.replace('_', ' ').lower() in text_lower:
+            resonance += 1
+        
+        return resonance
+    
+    def total_astronomical_resonance(self, text: str, text_lower: Optional[str] = None) -> float:
+        """Numeric-only 'total_resonance' of calculate_ancient_astronomical_resonance"""
+        if text_lower is None:
+            text_lower = text.lower()
+        total_resonance = 0
+        for system_name, system_data in self.ancient_astronomy_database.items():
+            resonance = self._system_raw_resonance(system_name, system_data, text, text_lower)
+            if resonance > 0:
+                total_resonance += resonance * abs(system_data['quantum_signature'])
+        return total_resonance
+    
     def _find_dominant_civilization(self, resonance_scores: Dict) -> str:
         """Find the civilization with highest resonance"""
         if not resonance_scores:
@@ -701,6 +807,15 @@ class LogogramGlyphProcessor:
     Incorporating logographic writing systems, hieroglyphs, cuneiform, and symbolic glyphs
     """
     
+    # Detected-element keys paired with the system name used in 'system_resonances'
+    _SYSTEM_RESONANCE_KEYS = (
+        ('hieroglyphs', 'egyptian'),
+        ('cuneiform', 'mesopotamian'),
+        ('chinese_characters', 'chinese'),
+        ('mayan_glyphs', 'mayan'),
+        ('symbolic_glyphs', 'symbolic'),
+    )
+    
     def __init__(self):
         self.logographic_systems = self._initialize_logographic_systems()
         self.hieroglyphic_database = self._initialize_hieroglyphic_database()
@@ -710,6 +825,16 @@ class LogogramGlyphProcessor:
         self.symbolic_glyph_database = self._initialize_symbolic_glyphs()
         self.glyph_quantum_signatures = self._initialize_glyph_quantum_signatures()
         self.logogram_semantic_networks = self._initialize_semantic_networks()
+        self.system_quantum_signatures = self._initialize_system_quantum_signatures()
+        self.glyph_index = self._build_glyph_index()
+        self.glyph_codepoints = np.array(sorted(ord(char) for char in self.glyph_index if len(char) == 1), dtype=np.uint32)
+        
+        # Result keys for every pair of known systems, built once instead of per matrix cell
+        system_names = [system_name for _, system_name in self._SYSTEM_RESONANCE_KEYS]
+        self._resonance_pair_keys = {
+            system1: {system2: f"{system1}_{system2}" for system2 in system_names}
+            for system1 in system_names
+        }
         
     def _initialize_logographic_systems(self) -> Dict[str, Dict]:
         """Initialize different logographic writing systems"""
@@ -1102,6 +1227,31 @@ class LogogramGlyphProcessor:
             'radical': complex(0.786, 0.618)        # Character component
         }
     
+    def _build_glyph_index(self) -> Dict[str, Tuple[str, Dict]]:
+        """Map every known glyph to its detected-element key and database entry"""
+        index = {}
+        # Earlier databases win when a character appears in more than one
+        for element_key, database in (
+            ('hieroglyphs', self.hieroglyphic_database),
+            ('cuneiform', self.cuneiform_database),
+            ('chinese_characters', self.chinese_character_database),
+            ('mayan_glyphs', self.mayan_glyph_database),
+            ('symbolic_glyphs', self.symbolic_glyph_database),
+        ):
+            for char, glyph_data in database.items():
+                index.setdefault(char, (element_key, glyph_data))
+        return index
+    
+    def _initialize_system_quantum_signatures(self) -> Dict[str, complex]:
+        """Resolve each system prefix to its hieroglyphic or cuneiform quantum signature"""
+        signatures = {}
+        # Hieroglyphic entries take precedence over cuneiform ones sharing a prefix
+        for suffix in ('_cuneiform', '_hieroglyphs'):
+            for system_key, system_data in self.logographic_systems.items():
+                if system_key.endswith(suffix):
+                    signatures[system_key[:-len(suffix)]] = system_data.get('quantum_signature', complex(0, 0))
+        return signatures
+    
     def _initialize_semantic_networks(self) -> Dict[str, Dict]:
         """Initialize semantic networks for logographic systems"""
         return {
@@ -1120,8 +1270,8 @@ class LogogramGlyphProcessor:
             }
         }
     
-    def detect_logograms_and_glyphs(self, text: str) -> Dict[str, Any]:
-        """Detect and analyze logograms and glyphs in text"""
+    def detect_logograms_and_glyphs(self, text: str, codepoints: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Detect and analyze logograms and glyphs in text (optionally from its pre-decoded codepoints)"""
         detected_elements = {
             'hieroglyphs': [],
             'cuneiform': [],
@@ -1134,79 +1284,32 @@ class LogogramGlyphProcessor:
             'system_resonances': {}
         }
         
-        # Check each character in text
-        for char in text:
-            # Check hieroglyphs
-            if char in self.hieroglyphic_database:
-                glyph_data = self.hieroglyphic_database[char]
-                detected_elements['hieroglyphs'].append({
-                    'character': char,
-                    'name': glyph_data['name'],
-                    'meaning': glyph_data['meaning'],
-                    'category': glyph_data['category'],
-                    'quantum_signature': glyph_data['quantum_signature'],
-                    'frequency': glyph_data['frequency']
-                })
-                detected_elements['quantum_signatures'].append(glyph_data['quantum_signature'])
-                self._merge_semantic_field(detected_elements['semantic_fields'], glyph_data['semantic_field'])
-            
-            # Check cuneiform
-            elif char in self.cuneiform_database:
-                glyph_data = self.cuneiform_database[char]
-                detected_elements['cuneiform'].append({
-                    'character': char,
-                    'name': glyph_data['name'],
-                    'meaning': glyph_data['meaning'],
-                    'category': glyph_data['category'],
-                    'quantum_signature': glyph_data['quantum_signature'],
-                    'frequency': glyph_data['frequency']
-                })
-                detected_elements['quantum_signatures'].append(glyph_data['quantum_signature'])
-                self._merge_semantic_field(detected_elements['semantic_fields'], glyph_data['semantic_field'])
-            
-            # Check Chinese characters
-            elif char in self.chinese_character_database:
-                char_data = self.chinese_character_database[char]
-                detected_elements['chinese_characters'].append({
-                    'character': char,
-                    'name': char_data['name'],
-                    'meaning': char_data['meaning'],
-                    'category': char_data['category'],
-                    'quantum_signature': char_data['quantum_signature'],
-                    'frequency': char_data['frequency'],
-                    'strokes': char_data['strokes'],
-                    'radical': char_data['radical']
-                })
-                detected_elements['quantum_signatures'].append(char_data['quantum_signature'])
-                self._merge_semantic_field(detected_elements['semantic_fields'], char_data['semantic_field'])
-            
-            # Check Maya glyphs
-            elif char in self.mayan_glyph_database:
-                glyph_data = self.mayan_glyph_database[char]
-                detected_elements['mayan_glyphs'].append({
-                    'character': char,
-                    'name': glyph_data['name'],
-                    'meaning': glyph_data['meaning'],
-                    'category': glyph_data['category'],
-                    'quantum_signature': glyph_data['quantum_signature'],
-                    'frequency': glyph_data['frequency']
-                })
-                detected_elements['quantum_signatures'].append(glyph_data['quantum_signature'])
-                self._merge_semantic_field(detected_elements['semantic_fields'], glyph_data['semantic_field'])
-            
-            # Check symbolic glyphs
-            elif char in self.symbolic_glyph_database:
-                glyph_data = self.symbolic_glyph_database[char]
-                detected_elements['symbolic_glyphs'].append({
-                    'character': char,
-                    'name': glyph_data['name'],
-                    'meaning': glyph_data['meaning'],
-                    'category': glyph_data['category'],
-                    'quantum_signature': glyph_data['quantum_signature'],
-                    'frequency': glyph_data['frequency']
-                })
-                detected_elements['quantum_signatures'].append(glyph_data['quantum_signature'])
-                self._merge_semantic_field(detected_elements['semantic_fields'], glyph_data['semantic_field'])
+        # Only glyph characters need per-character work; with pre-decoded codepoints
+        # they are picked out in NumPy before entering the Python loop
+        if codepoints is None:
+            glyph_chars = text
+        else:
+            glyph_chars = [chr(cp) for cp in codepoints[np.isin(codepoints, self.glyph_codepoints)].tolist()]
+        
+        for char in glyph_chars:
+            indexed = self.glyph_index.get(char)
+            if indexed is None:
+                continue
+            element_key, glyph_data = indexed
+            element = {
+                'character': char,
+                'name': glyph_data['name'],
+                'meaning': glyph_data['meaning'],
+                'category': glyph_data['category'],
+                'quantum_signature': glyph_data['quantum_signature'],
+                'frequency': glyph_data['frequency']
+            }
+            if element_key == 'chinese_characters':
+                element['strokes'] = glyph_data['strokes']
+                element['radical'] = glyph_data['radical']
+            detected_elements[element_key].append(element)
+            detected_elements['quantum_signatures'].append(glyph_data['quantum_signature'])
+            self._merge_semantic_field(detected_elements['semantic_fields'], glyph_data['semantic_field'])
         
         # Calculate total logographic content
         detected_elements['total_logographic_content'] = (
@@ -1218,19 +1321,17 @@ class LogogramGlyphProcessor:
         )
         
         # Calculate system resonances
-        if detected_elements['hieroglyphs']:
-            detected_elements['system_resonances']['egyptian'] = len(detected_elements['hieroglyphs'])
-        if detected_elements['cuneiform']:
-            detected_elements['system_resonances']['mesopotamian'] = len(detected_elements['cuneiform'])
-        if detected_elements['chinese_characters']:
-            detected_elements['system_resonances']['chinese'] = len(detected_elements['chinese_characters'])
-        if detected_elements['mayan_glyphs']:
-            detected_elements['system_resonances']['mayan'] = len(detected_elements['mayan_glyphs'])
-        if detected_elements['symbolic_glyphs']:
-            detected_elements['system_resonances']['symbolic'] = len(detected_elements['symbolic_glyphs'])
+        for key, system_name in self._SYSTEM_RESONANCE_KEYS:
+            count = len(detected_elements[key])
+            if count:
+                detected_elements['system_resonances'][system_name] = count
         
         return detected_elements
     
+    def count_logographic_content(self, codepoints: np.ndarray) -> int:
+        """Numeric-only 'total_logographic_content' from pre-decoded codepoints"""
+        return int(np.count_nonzero(np.isin(codepoints, self.glyph_codepoints)))
+    
     def _merge_semantic_field(self, target_field: Dict[str, float], source_field: Dict[str, float]):
         """Merge semantic fields with maximum values"""
         for key, value in source_field.items():
@@ -1280,15 +1381,15 @@ class LogogramGlyphProcessor:
         
         # Egyptian hieroglyphs meditation
         if detected_elements['hieroglyphs']:
-            for glyph in detected_elements['hieroglyphs'][:3]:  # Limit to 3
+            for glyph in islice(detected_elements['hieroglyphs'], 3):  # Limit to 3
                 meditation_levels.append({
                     'level': level_counter,
-                    'system': 'Egyptian Hieroglyphs',
+                    'system': _EGY_SYSTEM,
                     'glyph': glyph['character'],
                     'name': glyph['name'],
                     'meaning': glyph['meaning'],
-                    'focus': f"Contemplate the sacred meaning of {glyph['name']}: {glyph['meaning']}",
-                    'visualization': f"See the hieroglyph {glyph['character']} glowing with golden light on temple walls",
+                    'focus': ''.join((_EGY_FOCUS_PFX, glyph['name'], _FOCUS_SEP, glyph['meaning'])),
+                    'visualization': ''.join((_EGY_VIS_PFX, glyph['character'], _EGY_VIS_SFX)),
                     'breathing_pattern': self._generate_logographic_breathing(glyph['frequency']),
                     'quantum_signature': glyph['quantum_signature'],
                     'frequency': glyph['frequency']
@@ -1297,15 +1398,15 @@ class LogogramGlyphProcessor:
         
         # Chinese characters meditation
         if detected_elements['chinese_characters']:
-            for char in detected_elements['chinese_characters'][:3]:
+            for char in islice(detected_elements['chinese_characters'], 3):
                 meditation_levels.append({
                     'level': level_counter,
-                    'system': 'Chinese Characters',
+                    'system': _CHN_SYSTEM,
                     'glyph': char['character'],
                     'name': char['name'],
                     'meaning': char['meaning'],
-                    'focus': f"Meditate on the essence of {char['name']}: {char['meaning']}",
-                    'visualization': f"Visualize the character {char['character']} written with flowing brush strokes",
+                    'focus': ''.join((_CHN_FOCUS_PFX, char['name'], _FOCUS_SEP, char['meaning'])),
+                    'visualization': ''.join((_CHN_VIS_PFX, char['character'], _CHN_VIS_SFX)),
                     'breathing_pattern': self._generate_logographic_breathing(char['frequency']),
                     'quantum_signature': char['quantum_signature'],
                     'frequency': char['frequency'],
@@ -1315,15 +1416,15 @@ class LogogramGlyphProcessor:
         
         # Cuneiform meditation
         if detected_elements['cuneiform']:
-            for glyph in detected_elements['cuneiform'][:2]:
+            for glyph in islice(detected_elements['cuneiform'], 2):
                 meditation_levels.append({
                     'level': level_counter,
-                    'system': 'Sumerian Cuneiform',
+                    'system': _CUN_SYSTEM,
                     'glyph': glyph['character'],
                     'name': glyph['name'],
                     'meaning': glyph['meaning'],
-                    'focus': f"Connect with ancient Sumerian wisdom through {glyph['name']}: {glyph['meaning']}",
-                    'visualization': f"See the cuneiform {glyph['character']} pressed into clay tablets by ancient scribes",
+                    'focus': ''.join((_CUN_FOCUS_PFX, glyph['name'], _FOCUS_SEP, glyph['meaning'])),
+                    'visualization': ''.join((_CUN_VIS_PFX, glyph['character'], _CUN_VIS_SFX)),
                     'breathing_pattern': self._generate_logographic_breathing(glyph['frequency']),
                     'quantum_signature': glyph['quantum_signature'],
                     'frequency': glyph['frequency']
@@ -1334,24 +1435,32 @@ class LogogramGlyphProcessor:
     
     def _generate_logographic_breathing(self, frequency: float) -> str:
         """Generate breathing pattern based on glyph frequency"""
-        breath_cycle = max(4, min(10, int(frequency / 80)))
-        return f"Breathe with the rhythm of ancient wisdom: Inhale for {breath_cycle} counts (absorbing glyph energy), hold for {breath_cycle//2} (integrating meaning), exhale for {breath_cycle} (releasing old patterns)"
+        return _LOGOGRAPHIC_BREATHING[max(4, min(10, int(frequency / 80))) - 4]
     
     def calculate_cross_system_resonance(self, detected_elements: Dict) -> Dict[str, float]:
         """Calculate resonance between different logographic systems"""
-        systems = detected_elements['system_resonances'].keys()
+        systems = list(detected_elements['system_resonances'].keys())
         resonance_matrix = {}
         
-        for system1 in systems:
-            for system2 in systems:
-                if system1 != system2:
-                    # Calculate semantic overlap
-                    sig1 = self.logographic_systems.get(f"{system1}_hieroglyphs", self.logographic_systems.get(f"{system1}_cuneiform", {})).get('quantum_signature', complex(0, 0))
-                    sig2 = self.logographic_systems.get(f"{system2}_hieroglyphs", self.logographic_systems.get(f"{system2}_cuneiform", {})).get('quantum_signature', complex(0, 0))
-                    
-                    if sig1 != 0 and sig2 != 0:
-                        resonance = abs((sig1.conjugate() * sig2).real) / (abs(sig1) * abs(sig2))
-                        resonance_matrix[f"{system1}_{system2}"] = resonance
+        sigs = np.array([self.system_quantum_signatures.get(system, 0j) for system in systems], dtype=np.complex128)
+        magnitudes = np.abs(sigs)
+        active = magnitudes != 0
+        if np.count_nonzero(active) < 2:
+            return resonance_matrix
+        
+        # Normalized semantic overlap for every pair of systems at once
+        with np.errstate(divide='ignore', invalid='ignore'):
+            overlap = np.abs((sigs.conj()[:, None] * sigs[None, :]).real) / np.outer(magnitudes, magnitudes)
+        overlap = overlap.tolist()
+        
+        for i, system1 in enumerate(systems):
+            if not active[i]:
+                continue
+            pair_keys = self._resonance_pair_keys.get(system1, {})
+            for j, system2 in enumerate(systems):
+                if i != j and active[j]:
+                    pair_key = pair_keys.get(system2) or f"{system1}_{system2}"
+                    resonance_matrix[pair_key] = overlap[i][j]
         
         return resonance_matrix
 
@@ -1371,35 +1480,10 @@ class UnifiedAPOQuantumLogos:
     """
     
     def __init__(self):
-        # Initialize all processors PROPERLY
-        self.math_theory_processor = MathematicalTheoryProcessor()
-        self.ancient_astronomy_processor = AncientAstronomyProcessor()
-        self.logogram_processor = LogogramGlyphProcessor()
-        
-        # Initialize other components
-        try:
-            self.pseudoarch_processor = PseudoarchaeologyProcessor()
-        except NameError:
-            print("⚠️  PseudoarchaeologyProcessor not found - using fallback")
-            self.pseudoarch_processor = None
-        
-        # Provide a dummy HebrewGematriaProcessor if not defined elsewhere
-        try:
-            self.hebrew_processor = HebrewGematriaProcessor()
-        except NameError:
-            class HebrewGematriaProcessor:
-                def __init__(self):
-                    pass
+        # Analysis processors are built lazily on first use (see the cached properties below)
+        if HebrewGematriaProcessor is _FallbackHebrewGematriaProcessor:
             print("⚠️  HebrewGematriaProcessor not found - using fallback")
-            self.hebrew_processor = HebrewGematriaProcessor()
-    
-        # Initialize symbolic system if available
-        try:
-            from quantum_symbolic_logos import UnifiedQuantumSymbolicLogos
-            self.symbolic_processor = UnifiedQuantumSymbolicLogos()
-        except ImportError:
-            print("⚠️  Symbolic processor not available - using fallback")
-            self.symbolic_processor = None
+        self.hebrew_processor = HebrewGematriaProcessor()
 
         # Quantum state tracking - THESE NEED TO BE INSIDE __init__
         self.quantum_state_history = []
@@ -1412,14 +1496,43 @@ class UnifiedAPOQuantumLogos:
         
         # Mathematical foundation
         self.fundamental_equations = self._initialize_mathematical_foundation()
+        self.fundamental_equation_patterns = self._compile_equation_patterns()
         
         # Hebrew mystical layer
         self.hebrew_gematria = self._initialize_gematria()
+        self.hebrew_gematria_lut = self._build_gematria_lut()
         self.sefirot_tree = self._initialize_sefirot()
-        
+        self.sefirot_by_name = {sefira.key: sefira for sefira in self.sefirot_tree}
+    
+    @cached_property
+    def math_theory_processor(self) -> 'MathematicalTheoryProcessor':
+        return MathematicalTheoryProcessor()
+    
+    @cached_property
+    def ancient_astronomy_processor(self) -> AncientAstronomyProcessor:
+        return AncientAstronomyProcessor()
+    
+    @cached_property
+    def logogram_processor(self) -> LogogramGlyphProcessor:
+        return LogogramGlyphProcessor()
+    
+    @cached_property
+    def pseudoarch_processor(self):
+        # Availability is resolved once at import
+        if PseudoarchaeologyProcessor is None:
+            print("⚠️  PseudoarchaeologyProcessor not found - using fallback")
+            return None
+        return PseudoarchaeologyProcessor()
+    
+    @cached_property
+    def symbolic_processor(self) -> UnifiedQuantumSymbolicLogos:
+        return UnifiedQuantumSymbolicLogos()
+    
+    @property
+    def ancient_astronomy(self) -> AncientAstronomyProcessor:
         # Fix the attribute name mismatch
-        self.ancient_astronomy = self.ancient_astronomy_processor
-
+        return self.ancient_astronomy_processor
+    
     def _initialize_language_codes(self) -> Dict[str, LanguageInfo]:
         """Initialize language codes with quantum signatures"""
         return {
@@ -1447,16 +1560,16 @@ class UnifiedAPOQuantumLogos:
                              quantum_signature=complex(-0.866, 0.5)),
         }
     
-    def _initialize_punctuation(self) -> Dict[str, List[str]]:
+    def _initialize_punctuation(self) -> Dict[str, FrozenSet[str]]:
         """Initialize punctuation with quantum weights"""
         return {
-            'basic': ['.', ',', ';', ':', '!', '?', "'", '"'],
-            'advanced': ['…', '–', '—', '«', '»', '"', '"', ''', ''', '¿', '¡'],
-            'brackets': ['(', ')', '[', ']', '{', '}', '⟨', '⟩'],
-            'mathematical': ['±', '×', '÷', '∞', '≈', '≠', '≤', '≥'],
-            'currency': ['$', '€', '£', '¥', '₹', '₽', '¢'],
-            'symbols': ['©', '®', '™', '§', '¶', '†', '‡', '•', '★', '♦'],
-            'arrows': ['←', '→', '↑', '↓', '↔', '↕', '⇐', '⇒', '⇑', '⇓'],
+            'basic': frozenset(['.', ',', ';', ':', '!', '?', "'", '"']),
+            'advanced': frozenset(['…', '–', '—', '«', '»', '"', '"', ''', ''', '¿', '¡']),
+            'brackets': frozenset(['(', ')', '[', ']', '{', '}', '⟨', '⟩']),
+            'mathematical': frozenset(['±', '×', '÷', '∞', '≈', '≠', '≤', '≥']),
+            'currency': frozenset(['$', '€', '£', '¥', '₹', '₽', '¢']),
+            'symbols': frozenset(['©', '®', '™', '§', '¶', '†', '‡', '•', '★', '♦']),
+            'arrows': frozenset(['←', '→', '↑', '↓', '↔', '↕', '⇐', '⇒', '⇑', '⇓']),
         }
     
     def _initialize_script_ranges(self) -> Dict[ScriptType, List[Tuple[int, int]]]:
@@ -1492,6 +1605,15 @@ class UnifiedAPOQuantumLogos:
             'fibonacci_sequence': 'Fₙ = Fₙ₋₁ + Fₙ₋₂'
         }
     
+    def _compile_equation_patterns(self) -> Dict[str, re.Pattern]:
+        """One regex alternation per equation matching any of its whitespace-separated symbols"""
+        patterns = {}
+        for eq_name, equation in self.fundamental_equations.items():
+            symbols = sorted(set(equation.split()), key=len, reverse=True)
+            if symbols:
+                patterns[eq_name] = re.compile('|'.join(map(re.escape, symbols)))
+        return patterns
+    
     def _initialize_gematria(self) -> Dict[str, int]:
         """Initialize Hebrew gematria values"""
         return {
@@ -1500,20 +1622,27 @@ class UnifiedAPOQuantumLogos:
             'ק': 100, 'ר': 200, 'ש': 300, 'ת': 400
         }
     
-    def _initialize_sefirot(self) -> Dict[str, Dict]:
+    def _build_gematria_lut(self) -> np.ndarray:
+        """Codepoint-indexed gematria table covering the Hebrew block (0 for other characters)"""
+        lut = np.zeros(max(ord(letter) for letter in self.hebrew_gematria) + 1, dtype=np.int64)
+        for letter, value in self.hebrew_gematria.items():
+            lut[ord(letter)] = value
+        return lut
+    
+    def _initialize_sefirot(self) -> Tuple[Sefira, ...]:
         """Initialize the Tree of Life sefirot"""
-        return {
-            'keter': {'name': 'Crown', 'value': 620, 'level': 1, 'position': 'top'},
-            'chokhmah': {'name': 'Wisdom', 'value': 73, 'level': 2, 'position': 'right'},
-            'binah': {'name': 'Understanding', 'value': 67, 'level': 2, 'position': 'left'},
-            'chesed': {'name': 'Loving-kindness', 'value': 72, 'level': 3, 'position': 'right'},
-            'gevurah': {'name': 'Strength', 'value': 216, 'level': 3, 'position': 'left'},
-            'tiferet': {'name': 'Beauty', 'value': 1081, 'level': 3, 'position': 'center'},
-            'netzach': {'name': 'Victory', 'value': 148, 'level': 4, 'position': 'right'},
-            'hod': {'name': 'Glory', 'value': 15, 'level': 4, 'position': 'left'},
-            'yesod': {'name': 'Foundation', 'value': 80, 'level': 4, 'position': 'center'},
-            'malkhut': {'name': 'Kingdom', 'value': 496, 'level': 5, 'position': 'bottom'}
-        }
+        return (
+            Sefira('keter', 'Crown', 620, 1, 'top'),
+            Sefira('chokhmah', 'Wisdom', 73, 2, 'right'),
+            Sefira('binah', 'Understanding', 67, 2, 'left'),
+            Sefira('chesed', 'Loving-kindness', 72, 3, 'right'),
+            Sefira('gevurah', 'Strength', 216, 3, 'left'),
+            Sefira('tiferet', 'Beauty', 1081, 3, 'center'),
+            Sefira('netzach', 'Victory', 148, 4, 'right'),
+            Sefira('hod', 'Glory', 15, 4, 'left'),
+            Sefira('yesod', 'Foundation', 80, 4, 'center'),
+            Sefira('malkhut', 'Kingdom', 496, 5, 'bottom'),
+        )
 
     # Add other missing methods
     def analyze_mathematical_theories(self, text: str) -> Dict[str, Any]:
@@ -1540,23 +1669,133 @@ class UnifiedAPOQuantumLogos:
     def _calculate_mathematical_resonance(self, text: str) -> Dict[str, float]:
         """Calculate mathematical resonance"""
         resonances = {}
-        for eq_name, equation in self.fundamental_equations.items():
-            if any(symbol in text for symbol in equation.split()):
+        for eq_name, pattern in self.fundamental_equation_patterns.items():
+            if pattern.search(text):
                 resonances[eq_name] = 0.8
         return resonances if resonances else {'default': 0.1}
     
-    def _analyze_hebrew_mystical_content(self, text: str) -> Dict[str, Any]:
+    def _analyze_hebrew_mystical_content(self, text: str, codepoints: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Analyze Hebrew mystical content"""
-        gematria_sum = 0
-        for char in text:
-            if char in self.hebrew_gematria:
-                gematria_sum += self.hebrew_gematria[char]
+        if codepoints is None:
+            codepoints = _decode_codepoints(text)
+        gematria_sum = self._gematria_sum(codepoints)
         
         return {
             'gematria_value': gematria_sum,
             'sefirot_resonance': gematria_sum % 10,
             'mystical_significance': 'High' if gematria_sum > 500 else 'Medium' if gematria_sum > 100 else 'Low'
         }
+    
+    def _gematria_sum(self, codepoints: np.ndarray) -> int:
+        """Sum gematria values in NumPy instead of a per-character dict lookup"""
+        lut = self.hebrew_gematria_lut
+        return int(lut[codepoints[codepoints < len(lut)]].sum())
+    
+    def _scan_once(self, text: str) -> Dict[str, Any]:
+        """Shared read of the input text reused by all analysis layers"""
+        return {
+            'text_lower': text.lower(),
+            'codepoints': _decode_codepoints(text)
+        }
+    
+    def process_unified_logos(self, text: str) -> Dict[str, Any]:
+        """Process text through all analysis layers"""
+        
+        # Decode and lowercase the text once for every analyzer
+        scan = self._scan_once(text)
+        
+        # Mathematical Theory Analysis
+        math_analysis = self.math_theory_processor.generate_quantum_mathematical_interpretation(text, scan['text_lower'])
+        
+        # Ancient Astronomy Analysis  
+        astro_analysis = self.ancient_astronomy_processor.calculate_ancient_astronomical_resonance(text, scan['text_lower'])
+        
+        # Logogram Analysis
+        logo_analysis = self.logogram_processor.detect_logograms_and_glyphs(text, scan['codepoints'])
+        
+        # Hebrew Mystical Analysis
+        hebrew_analysis = self._analyze_hebrew_mystical_content(text, scan['codepoints'])
+        
+        # Calculate unified quantum state
+        unified_signature = self._calculate_unified_signature(
+            math_analysis, astro_analysis, logo_analysis, hebrew_analysis
+        )
+        
+        # Update consciousness field
+        self._update_consciousness_field(unified_signature)
+        
+        return {
+            'math_theory_analysis': math_analysis,
+            'astronomical_analysis': astro_analysis,
+            'logographic_analysis': logo_analysis,
+            'hebrew_mystical_analysis': hebrew_analysis,
+            'unified_signature': unified_signature,
+            'consciousness_field': self.consciousness_field,
+            'processing_timestamp': 'current'
+        }
+    
+    def process_unified_logos_batch(self, texts: Sequence[str]) -> np.ndarray:
+        """Unified signatures for many texts, skipping the per-text analysis dicts"""
+        return self.process_unified_logos_columns(texts)['unified_signature']
+    
+    def process_unified_logos_columns(self, texts: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Per-layer scores and unified signatures for many texts as columnar arrays"""
+        count = len(texts)
+        columns = {
+            'total_mathematical_content': np.empty(count, dtype=np.int64),
+            'total_resonance': np.empty(count, dtype=np.float64),
+            'total_logographic_content': np.empty(count, dtype=np.int64),
+            'gematria_value': np.empty(count, dtype=np.int64),
+            'unified_signature': np.empty(count, dtype=np.complex128)
+        }
+        math_processor = self.math_theory_processor
+        astro_processor = self.ancient_astronomy_processor
+        logo_processor = self.logogram_processor
+        
+        for i, text in enumerate(texts):
+            scan = self._scan_once(text)
+            codepoints = scan['codepoints']
+            math_content = math_processor.count_mathematical_content(scan['text_lower'])
+            astro_resonance = astro_processor.total_astronomical_resonance(text, scan['text_lower'])
+            logo_content = logo_processor.count_logographic_content(codepoints)
+            hebrew_gematria = self._gematria_sum(codepoints)
+            signature = self._combine_unified_signature(math_content, astro_resonance, logo_content, hebrew_gematria)
+            self._update_consciousness_field(signature)
+            
+            columns['total_mathematical_content'][i] = math_content
+            columns['total_resonance'][i] = astro_resonance
+            columns['total_logographic_content'][i] = logo_content
+            columns['gematria_value'][i] = hebrew_gematria
+            columns['unified_signature'][i] = signature
+        
+        return columns
+    
+    def _update_consciousness_field(self, unified_signature: complex):
+        """Evolve the consciousness field, renormalizing its magnitude before it overflows or goes denormal"""
+        self.consciousness_field *= (1 + unified_signature * 0.1)
+        magnitude = abs(self.consciousness_field)
+        if magnitude > _CONSCIOUSNESS_FIELD_MAX or 0 < magnitude < _CONSCIOUSNESS_FIELD_MIN:
+            self.consciousness_field /= magnitude
+    
+    def _calculate_unified_signature(self, math_analysis, astro_analysis, logo_analysis, hebrew_analysis) -> complex:
+        """Calculate unified quantum signature from all analyses"""
+        
+        # Extract numerical values
+        return self._combine_unified_signature(
+            math_analysis.get('total_mathematical_content', 0),
+            astro_analysis.get('total_resonance', 0),
+            logo_analysis.get('total_logographic_content', 0),
+            hebrew_analysis.get('gematria_value', 0)
+        )
+    
+    @staticmethod
+    def _combine_unified_signature(math_content: float, astro_resonance: float,
+                                   logo_content: float, hebrew_gematria: float) -> complex:
+        """Combine the four layer scores into a complex signature"""
+        real_component = (math_content + astro_resonance) / 10
+        imag_component = (logo_content + hebrew_gematria / 100) / 10
+        
+        return complex(real_component, imag_component)
 
 class MathematicalTheoryProcessor:
     """
@@ -1570,6 +1809,21 @@ class MathematicalTheoryProcessor:
         self.symbolic_mathematical_relationships = self._initialize_symbolic_relationships()
         self.consciousness_mathematical_bridge = self._initialize_consciousness_bridge()
         
+        # Precompiled lookup indexes for expression scanning
+        self.equation_keyword_index = self._build_equation_keyword_index()
+        self.pattern_keyword_index = self._build_pattern_keyword_index()
+        
+        # Structure-of-arrays resonance tables with the phase terms precomputed
+        self.equation_rows = {eq_name: i for i, eq_name in enumerate(self.mathematical_equations)}
+        self.equation_resonances = np.array([eq_data['logos_resonance'] for eq_data in self.mathematical_equations.values()], dtype=np.float64)
+        self.equation_real = self.equation_resonances * np.cos(self.equation_resonances * np.pi)
+        self.equation_imag = self.equation_resonances * np.sin(self.equation_resonances * np.pi)
+        
+        self.pattern_rows = {(pattern_type, concept): i for i, (_, concept, pattern_type, _) in enumerate(self.pattern_keyword_index)}
+        self.pattern_resonances = np.array([row[3] for row in self.pattern_keyword_index], dtype=np.float64)
+        self.pattern_real = self.pattern_resonances * np.cos(self.pattern_resonances * np.pi / 2)
+        self.pattern_imag = self.pattern_resonances * np.sin(self.pattern_resonances * np.pi / 2)
+        
     def _initialize_mathematical_foundation(self) -> Dict[str, Dict[str, Any]]:
         """Initialize the 17 fundamental mathematical equations with complete definitions"""
         return {
@@ -1720,6 +1974,24 @@ class MathematicalTheoryProcessor:
             'observer_effect': 0.92
         }
     
+    def _build_equation_keyword_index(self) -> Dict[str, Tuple[str, ...]]:
+        """Map each detection keyword to the equations it identifies"""
+        index: Dict[str, List[str]] = {}
+        for eq_name, eq_data in self.mathematical_equations.items():
+            for keyword in (eq_name.replace('_', ' '), eq_data['description'].lower().split()[0]):
+                equations = index.setdefault(keyword, [])
+                if eq_name not in equations:
+                    equations.append(eq_name)
+        return {keyword: tuple(equations) for keyword, equations in index.items()}
+    
+    def _build_pattern_keyword_index(self) -> Tuple[Tuple[str, str, str, float], ...]:
+        """Flatten quantum mappings into (keyword, concept, type, resonance) rows"""
+        return tuple(
+            (concept.lower(), concept, pattern_type, resonance)
+            for pattern_type, mappings in self.quantum_mathematical_mappings.items()
+            for concept, resonance in mappings.items()
+        )
+    
     def analyze_mathematical_expression(self, expression: str) -> Dict[str, Any]:
         """Analyze a mathematical expression for quantum-linguistic content"""
         analysis = {
@@ -1730,10 +2002,16 @@ class MathematicalTheoryProcessor:
             'consciousness_mapping': 0.0
         }
         
-        # Detect known equations
+        expr_lower = expression.lower()
+        
+        # Detect known equations - each distinct keyword is scanned once
+        matched_equations = set()
+        for keyword, equations in self.equation_keyword_index.items():
+            if keyword in expr_lower:
+                matched_equations.update(equations)
+        
         for eq_name, eq_data in self.mathematical_equations.items():
-            # Simple keyword matching - can be enhanced
-            if any(keyword in expression.lower() for keyword in [eq_name.replace('_', ' '), eq_data['description'].lower().split()[0]]):
+            if eq_name in matched_equations:
                 analysis['detected_equations'].append({
                     'name': eq_name,
                     'equation': eq_data['equation'],
@@ -1743,14 +2021,13 @@ class MathematicalTheoryProcessor:
                 analysis['quantum_resonance'] += eq_data['logos_resonance']
         
         # Detect mathematical patterns
-        for pattern_type, mappings in self.quantum_mathematical_mappings.items():
-            for concept, resonance in mappings.items():
-                if concept.lower() in expression.lower():
-                    analysis['mathematical_patterns'].append({
-                        'concept': concept,
-                        'type': pattern_type,
-                        'resonance': resonance
-                    })
+        for keyword, concept, pattern_type, resonance in self.pattern_keyword_index:
+            if keyword in expr_lower:
+                analysis['mathematical_patterns'].append({
+                    'concept': concept,
+                    'type': pattern_type,
+                    'resonance': resonance
+                })
         
         # Normalize resonance
         if analysis['detected_equations']:
@@ -1758,7 +2035,7 @@ class MathematicalTheoryProcessor:
         
         return analysis
     
-    def generate_quantum_mathematical_interpretation(self, text: str) -> Dict[str, Any]:
+    def generate_quantum_mathematical_interpretation(self, text: str, text_lower: Optional[str] = None) -> Dict[str, Any]:
         """Generate quantum-mathematical interpretation of text"""
         interpretation = {
             'mathematical_patterns': [],
@@ -1766,43 +2043,57 @@ class MathematicalTheoryProcessor:
             'total_mathematical_content': 0
         }
         
+        if text_lower is None:
+            text_lower = text.lower()
+        
         # Analyze for mathematical patterns
-        for pattern_type, mappings in self.quantum_mathematical_mappings.items():
-            for concept, resonance in mappings.items():
-                if concept.lower() in text.lower():
-                    interpretation['mathematical_patterns'].append({
-                        'concept': concept,
-                        'type': pattern_type,
-                        'resonance': resonance
-                    })
+        for keyword, concept, pattern_type, resonance in self.pattern_keyword_index:
+            if keyword in text_lower:
+                interpretation['mathematical_patterns'].append({
+                    'concept': concept,
+                    'type': pattern_type,
+                    'resonance': resonance
+                })
         
         # Calculate total content
         interpretation['total_mathematical_content'] = len(interpretation['mathematical_patterns'])
         
         return interpretation
     
+    def count_mathematical_content(self, text_lower: str) -> int:
+        """Numeric-only 'total_mathematical_content' for already-lowercased text"""
+        return sum(1 for keyword, _, _, _ in self.pattern_keyword_index if keyword in text_lower)
+    
     def calculate_mathematical_quantum_state(self, analysis: Dict[str, Any]) -> complex:
         """Calculate quantum state from mathematical analysis"""
         if not analysis.get('detected_equations') and not analysis.get('mathematical_patterns'):
             return complex(0, 0)
         
-        real_component = 0
-        imag_component = 0
-        total_elements = 0
+        equations = analysis.get('detected_equations', [])
+        patterns = analysis.get('mathematical_patterns', [])
         
         # Contribution from detected equations
-        for equation in analysis.get('detected_equations', []):
-            resonance = equation['resonance']
-            real_component += resonance * math.cos(resonance * math.pi)
-            imag_component += resonance * math.sin(resonance * math.pi)
-            total_elements += 1
+        eq_real, eq_imag, eq_pending = self._sum_table_components(
+            equations, [self.equation_rows.get(equation.get('name')) for equation in equations],
+            self.equation_resonances, self.equation_real, self.equation_imag
+        )
         
         # Contribution from mathematical patterns
-        for pattern in analysis.get('mathematical_patterns', []):
-            resonance = pattern['resonance']
-            real_component += resonance * math.cos(resonance * math.pi / 2)
-            imag_component += resonance * math.sin(resonance * math.pi / 2)
-            total_elements += 1
+        pat_real, pat_imag, pat_pending = self._sum_table_components(
+            patterns, [self.pattern_rows.get((pattern.get('type'), pattern.get('concept'))) for pattern in patterns],
+            self.pattern_resonances, self.pattern_real, self.pattern_imag
+        )
+        
+        real_component = eq_real + pat_real
+        imag_component = eq_imag + pat_imag
+        
+        # Entries not covered by the tables are rare, so they are summed in plain Python
+        if eq_pending or pat_pending:
+            pending = _accumulate_resonance(eq_pending, pat_pending)
+            real_component += pending.real
+            imag_component += pending.imag
+        
+        total_elements = len(equations) + len(patterns)
         
         # Normalize
         if total_elements > 0:
@@ -1810,57 +2101,23 @@ class MathematicalTheoryProcessor:
             imag_component /= total_elements
         
         return complex(real_component, imag_component)
-
-# Add the missing process_unified_logos method to UnifiedAPOQuantumLogos
-# (Removed duplicate class definition)
-
-    def process_unified_logos(self, text: str) -> Dict[str, Any]:
-        """Process text through all analysis layers"""
-        
-        # Mathematical Theory Analysis
-        math_analysis = self.math_theory_processor.generate_quantum_mathematical_interpretation(text)
-        
-        # Ancient Astronomy Analysis  
-        astro_analysis = self.ancient_astronomy_processor.calculate_ancient_astronomical_resonance(text)
-        
-        # Logogram Analysis
-        logo_analysis = self.logogram_processor.detect_logograms_and_glyphs(text)
-        
-        # Hebrew Mystical Analysis
-        hebrew_analysis = self._analyze_hebrew_mystical_content(text)
-        
-        # Calculate unified quantum state
-        unified_signature = self._calculate_unified_signature(
-            math_analysis, astro_analysis, logo_analysis, hebrew_analysis
-        )
-        
-        # Update consciousness field
-        self.consciousness_field *= (1 + unified_signature * 0.1)
-        
-        return {
-            'math_theory_analysis': math_analysis,
-            'astronomical_analysis': astro_analysis,
-            'logographic_analysis': logo_analysis,
-            'hebrew_mystical_analysis': hebrew_analysis,
-            'unified_signature': unified_signature,
-            'consciousness_field': self.consciousness_field,
-            'processing_timestamp': 'current'
-        }
     
-    def _calculate_unified_signature(self, math_analysis, astro_analysis, logo_analysis, hebrew_analysis) -> complex:
-        """Calculate unified quantum signature from all analyses"""
-        
-        # Extract numerical values
-        math_content = math_analysis.get('total_mathematical_content', 0)
-        astro_resonance = astro_analysis.get('total_resonance', 0)
-        logo_content = logo_analysis.get('total_logographic_content', 0)
-        hebrew_gematria = hebrew_analysis.get('gematria_value', 0)
-        
-        # Combine into complex signature
-        real_component = (math_content + astro_resonance) / 10
-        imag_component = (logo_content + hebrew_gematria / 100) / 10
-        
-        return complex(real_component, imag_component)
+    def _sum_table_components(self, entries: List[Dict[str, Any]], rows: List[Optional[int]], resonance_table: np.ndarray,
+                              real_table: np.ndarray, imag_table: np.ndarray) -> Tuple[float, float, List[float]]:
+        """Sum precomputed resonance components; return resonances of entries not in the tables
+
+        The caller's 'resonance' value always wins: an entry whose value differs from the
+        table row is returned as pending rather than summed from the precomputed terms.
+        """
+        known_rows = []
+        pending = []
+        for entry, row in zip(entries, rows):
+            resonance = entry['resonance']
+            if row is not None and resonance == resonance_table[row]:
+                known_rows.append(row)
+            else:
+                pending.append(resonance)
+        return float(real_table[known_rows].sum()), float(imag_table[known_rows].sum()), pending
 
 # Add these classes for compatibility with apo_quantum_evolution.py
 
@@ -1873,21 +2130,49 @@ class APOSystem:
     
     def process_text(self, text: str) -> Dict[str, Any]:
         return self.unified_logos.process_unified_logos(text)
+    
+    def process_batch(self, texts: Sequence[str]) -> List[Dict[str, Any]]:
+        """Summary scores for many texts; dicts are only assembled from the columnar results at the end"""
+        columns = self.unified_logos.process_unified_logos_columns(texts)
+        rows = zip(*(column.tolist() for column in columns.values()))
+        return [dict(zip(columns.keys(), row)) for row in rows]
 
 class APOQuantumRegister:
     """Quantum register for APO system"""
+    GATE_CODES = {'H': 0, 'X': 1}
+    
     def __init__(self, size: int = 32):
         self.size = size
-        self.qubits = [complex(1, 0) for _ in range(size)]
+        self.qubits = np.ones(size, dtype=np.complex128)
         self.entangled = False
     
     def apply_gate(self, gate: str, qubit_index: int):
         """Apply quantum gate to qubit"""
         if gate == 'H':  # Hadamard
-            self.qubits[qubit_index] = complex(0.707, 0.707)
+            self.qubits[qubit_index] = 0.707 + 0.707j
         elif gate == 'X':  # Pauli-X
-            real, imag = self.qubits[qubit_index].real, self.qubits[qubit_index].imag
-            self.qubits[qubit_index] = complex(imag, real)
+            amplitude = self.qubits[qubit_index]
+            self.qubits[qubit_index] = complex(amplitude.imag, amplitude.real)
+    
+    def apply_gates_batch(self, gate_codes: np.ndarray, indices: np.ndarray):
+        """Apply a sequence of gates (codes from GATE_CODES) to the given qubit indices in one kernel call
+
+        Indices follow apply_gate: negative values count from the end and anything
+        outside [-size, size) raises IndexError before the kernel runs, since the
+        compiled kernel does no bounds checking of its own.
+        """
+        gate_codes = np.asarray(gate_codes)
+        indices = np.asarray(indices)
+        if gate_codes.ndim != 1 or indices.ndim != 1 or gate_codes.shape != indices.shape:
+            raise ValueError("gate_codes and indices must be 1-D sequences of equal length")
+        if gate_codes.size == 0:
+            return
+        if not (np.issubdtype(gate_codes.dtype, np.integer) and np.issubdtype(indices.dtype, np.integer)):
+            raise TypeError("gate_codes and indices must be integers")
+        if indices.min() < -self.size or indices.max() >= self.size:
+            raise IndexError(f"qubit index out of range for register of size {self.size}")
+        indices = np.where(indices < 0, indices + self.size, indices).astype(np.int64)
+        _apply_gates_kernel(self.qubits, gate_codes.astype(np.int64), indices)
 
 class APOEntanglement:
     """Quantum entanglement for APO system"""
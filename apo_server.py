@@ -1,20 +1,55 @@
+import os
+import queue
 from flask import Flask, request, jsonify
 from apo_quantum_logos import UnifiedAPOQuantumLogos
 
 app = Flask(__name__)
 
+# Processors are built lazily on first use; build them at import instead so
+# they are created before Gunicorn forks (preload_app) and shared by workers
+_LAZY_PROCESSORS = (
+    'math_theory_processor',
+    'ancient_astronomy_processor',
+    'logogram_processor',
+    'pseudoarch_processor',
+    'symbolic_processor',
+)
+
+def _warm(instance):
+    for name in _LAZY_PROCESSORS:
+        getattr(instance, name)
+    return instance
+
 # Initialize the ΑΠΩ system
-apo = UnifiedAPOQuantumLogos()
+apo = _warm(UnifiedAPOQuantumLogos())
+
+# process_unified_logos updates the instance's consciousness field, so each
+# concurrent request checks out its own warm instance instead of sharing one.
+# A worker serves at most APO_THREADS requests at once (see gunicorn_conf.py),
+# so that is the default pool size.
+#
+# Behaviour change from the single shared instance: every pooled instance (and
+# every Gunicorn worker process) evolves its own consciousness field, so the
+# 'consciousness_field' returned by /process depends on which instance served
+# the request rather than on the global request history.
+_POOL_SIZE = int(os.environ.get('APO_POOL_SIZE', os.environ.get('APO_THREADS', 4)))
+_instances = queue.Queue()
+_instances.put(apo)
+for _ in range(_POOL_SIZE - 1):
+    _instances.put(_warm(UnifiedAPOQuantumLogos()))
 
 @app.route('/process', methods=['POST'])
 def process():
     data = request.get_json()
     text = data.get('text', '')
+    instance = _instances.get()
     try:
-        result = apo.process_unified_logos(text)
+        result = instance.process_unified_logos(text)
         return jsonify({'success': True, 'result': result})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
+    finally:
+        _instances.put(instance)
 
 @app.route('/login', methods=['POST'])
 def login():
@@ -28,4 +63,11 @@ def login():
         return jsonify({'success': False, 'message': 'Invalid credentials'}), 401
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    # Local runs only; serve production traffic with:
+    #   gunicorn -c gunicorn_conf.py apo_server:app
+    app.run(
+        host='0.0.0.0',
+        port=int(os.environ.get('PORT', 5000)),
+        debug=False,
+        threaded=True
+    )
@@ -2,18 +2,28 @@
 APO Engine: Symbolic Interpreter, Fibonacci Entangler, Spiritual Logic
 Copyright (c) 2025 Paul Morales, Alpha Pi Omega Corp (alphapiomega.com)
 """
+import re
+
+# Symbol separator, absorbing surrounding whitespace
+_ARROW = re.compile(r"\s*→\s*")
+
+def _fibonacci():
+    """Yield F(1), F(2), F(3), ... without keeping earlier values"""
+    a, b = 1, 1
+    while True:
+        yield a
+        a, b = b, a + b
 
 class APOEngine:
     def interpret_symbols(self, input_str):
         # TODO: Implement full APO symbolic parser
-        return [s.strip() for s in input_str.split("→")]
+        return _ARROW.split(input_str.strip())
 
     def generate_fibonacci_wave(self, symbols):
         # Example: Map each symbol to a Fibonacci number
-        fib = [0, 1]
-        for i in range(2, len(symbols)+2):
-            fib.append(fib[-1] + fib[-2])
-        return {s: fib[i+1] for i, s in enumerate(symbols)}
+        # The zip stops after len(symbols) values; nothing is shared between
+        # calls, so concurrent requests cannot interfere and memory stays per-call
+        return dict(zip(symbols, _fibonacci()))
 
     def spiritual_logic(self, symbols):
         # Placeholder for spiritual/recursive logic
@@ -2,6 +2,16 @@
 OptimusChatbot: Conversational Agent for APO/Quantum/Real-World API
 Copyright (c) 2025 Paul Morales, Alpha Pi Omega Corp (alphapiomega.com)
 """
+import re
+
+# One case-insensitive scan finds the first keyword without lowercasing the message
+_KEYWORDS = re.compile(r"quantum|symbolic", re.IGNORECASE | re.ASCII)
+_QUANTUM = re.compile(r"quantum", re.IGNORECASE | re.ASCII)
+
+_REPLIES = {
+    "quantum": "Quantum logic engaged. (Simulated response)",
+    "symbolic": "Symbolic logic engaged. (Simulated response)",
+}
 
 class OptimusChatbot:
     def __init__(self):
@@ -11,9 +21,11 @@ class OptimusChatbot:
         # Placeholder: In production, call OpenAI/Azure OpenAI or local LLM
         self.history.append({"user": message})
         # Example: Use symbolic/quantum/agent logic here
-        if "quantum" in message.lower():
-            return "Quantum logic engaged. (Simulated response)"
-        elif "symbolic" in message.lower():
-            return "Symbolic logic engaged. (Simulated response)"
-        else:
+        match = _KEYWORDS.search(message)
+        if match is None:
             return "Optimus: I am ready to assist with APO, quantum, or real-world logic."
+        keyword = match.group().lower()
+        # "quantum" takes precedence even when it follows "symbolic"
+        if keyword == "symbolic" and _QUANTUM.search(message, match.end()):
+            keyword = "quantum"
+        return _REPLIES[keyword]
@@ -3,12 +3,76 @@ Quantum Core: Qiskit/Cirq Quantum Circuit Builder/Executor
 Copyright (c) 2025 Paul Morales, Alpha Pi Omega Corp (alphapiomega.com)
 """
 
+import threading
+from functools import lru_cache
+
 try:
-    from qiskit import QuantumCircuit, Aer, execute
+    from qiskit import QuantumCircuit, Aer, transpile
     QISKIT_AVAILABLE = True
 except ImportError:
     QISKIT_AVAILABLE = False
 
+# Transpiled circuits keyed by their structure, oldest evicted first
+_TRANSPILE_CACHE_SIZE = 32
+_transpiled = {}
+_transpiled_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _get_backend():
+    return Aer.get_backend('qasm_simulator')
+
+def _condition_key(circuit, condition):
+    """Structural form of a c_if condition: register by name and size, bit by index"""
+    if isinstance(condition, tuple) and len(condition) == 2:
+        target, value = condition
+        if hasattr(target, 'size'):
+            return ('register', target.name, target.size, value)
+        return ('bit', circuit.find_bit(target).index, value)
+    # No condition, or a newer expression-style condition used as-is
+    return condition
+
+def _circuit_key(circuit):
+    """Hashable description of a circuit's registers, global phase and instructions
+
+    Returns None when part of the circuit is unhashable (e.g. the ndarray
+    params of a unitary gate); such circuits are transpiled without caching.
+    """
+    key = (
+        tuple((reg.name, reg.size) for reg in circuit.qregs),
+        tuple((reg.name, reg.size) for reg in circuit.cregs),
+        circuit.num_qubits,
+        circuit.num_clbits,
+        circuit.global_phase,
+        tuple(
+            (inst.operation.name,
+             tuple(circuit.find_bit(q).index for q in inst.qubits),
+             tuple(circuit.find_bit(c).index for c in inst.clbits),
+             tuple(inst.operation.params),
+             _condition_key(circuit, getattr(inst.operation, 'condition', None)))
+            for inst in circuit.data
+        )
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+def _transpile_cached(circuit, backend):
+    key = _circuit_key(circuit)
+    if key is None:
+        return transpile(circuit, backend)
+    with _transpiled_lock:
+        compiled = _transpiled.get(key)
+    if compiled is None:
+        # Transpile outside the lock; a concurrent miss on the same key only repeats work
+        compiled = transpile(circuit, backend)
+        with _transpiled_lock:
+            if key not in _transpiled and len(_transpiled) >= _TRANSPILE_CACHE_SIZE:
+                del _transpiled[next(iter(_transpiled))]
+            _transpiled[key] = compiled
+    return compiled
+
 class QuantumCore:
     def create_bell_circuit(self):
         if not QISKIT_AVAILABLE:
@@ -22,8 +86,8 @@ class QuantumCore:
     def execute_circuit(self, circuit, shots=1024):
         if not QISKIT_AVAILABLE or circuit is None:
             return {"error": "Qiskit not available or circuit invalid"}
-        backend = Aer.get_backend('qasm_simulator')
-        job = execute(circuit, backend, shots=shots)
+        backend = _get_backend()
+        job = backend.run(_transpile_cached(circuit, backend), shots=shots)
         result = job.result()
         counts = result.get_counts()
         return {"counts": counts}
@@ -0,0 +1,27 @@
+"""
+Out-of-line cffi build for the native Fibonacci kernel used by main.fib
+Build with: python build_fib.py  (produces the _fib extension module)
+"""
+from cffi import FFI
+
+ffibuilder = FFI()
+ffibuilder.cdef("uint64_t fib_u64(uint32_t n);")
+ffibuilder.set_source(
+    "_fib",
+    """
+    #include <stdint.h>
+    /* Exact for n <= 93; wraps modulo 2**64 beyond that */
+    uint64_t fib_u64(uint32_t n) {
+        uint64_t a = 0, b = 1, t;
+        while (n--) {
+            t = a + b;
+            a = b;
+            b = t;
+        }
+        return a;
+    }
+    """,
+)
+
+if __name__ == "__main__":
+    ffibuilder.compile(verbose=True)
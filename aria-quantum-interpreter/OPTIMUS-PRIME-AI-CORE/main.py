@@ -1,16 +1,57 @@
 # Optimus Prime APO Engine – Azure App Service Ready
 from fastapi import FastAPI, Request
-from pydantic import BaseModel
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field, ValidationError
+from typing import List
+import os
 import random
+import time
 import uuid
-from datetime import datetime
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
 
-app = FastAPI()
+# Optional JIT compilation for the /energy hot path
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional fast JSON serialization for responses
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional native Fibonacci kernel, built by build_fib.py
+try:
+    from _fib import lib as _fib_lib
+except ImportError:
+    _fib_lib = None
+
+# Largest n whose Fibonacci number fits in a uint64
+_FIB_U64_MAX_N = 93
+# Largest n whose Fibonacci number converts to a float; the energy of any
+# larger index overflows, so requests above it are rejected up front
+_FIB_FLOAT_MAX_N = 1476
+
+if orjson is not None:
+    class ORJSONResponse(JSONResponse):
+        def render(self, content) -> bytes:
+            return orjson.dumps(content)
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+else:
+    app = FastAPI()
 
 # --- APO Logic Modules ---
 APO_OPERATORS = [
     "MATH", "CODE", "QUANTA", "INTERFACE", "THOUGHT", "INTERACT", "SOLVE", "COMMERCE"
 ]
+# Prebuilt /route responses for the known operators
+_ROUTES = {op: f"Routing to APO domain: {op}" for op in APO_OPERATORS}
 
 CORE_PI_OPERATORS = {
     "απ": "Alpha Origin Pulse",
@@ -22,28 +63,124 @@ CORE_PI_OPERATORS = {
     "Ξε": "Eve Collapse Fork"
 }
 
+PLANCK_H = 6.626e-34
+PI = 3.141592653589793
+
+def _apo_energy_core(n, freq):
+    """h * pi * F(n) * freq with F(n) computed exactly in uint64 (n < 93)"""
+    a = np.uint64(0)
+    b = np.uint64(1)
+    bit = 1
+    while bit <= n:
+        bit <<= 1
+    bit >>= 1
+    while bit:
+        c = a * (np.uint64(2) * b - a)
+        d = a * a + b * b
+        if n & bit:
+            a = d
+            b = c + d
+        else:
+            a = c
+            b = d
+        bit >>= 1
+    return PLANCK_H * PI * float(a) * freq
+
+def _apo_energy_batch_core(ns, freqs):
+    """Element-wise _apo_energy_core over int64 ns and float64 freqs"""
+    out = np.empty(ns.shape[0])
+    for i in range(ns.shape[0]):
+        out[i] = _apo_energy_core(ns[i], freqs[i])
+    return out
+
+if njit is not None:
+    _apo_energy_core = njit(cache=True)(_apo_energy_core)
+    # Serial on purpose: a parallel kernel called from FastAPI's threadpool can
+    # abort the worker under numba's non-thread-safe workqueue layer
+    _apo_energy_batch_core = njit(cache=True)(_apo_energy_batch_core)
+    # Compile at import rather than on the first request
+    _apo_energy_core(1, 1.0)
+    _apo_energy_batch_core(np.ones(1, dtype=np.int64), np.ones(1))
+
+# Maps ASCII letters to their upper-case code and every other byte to 0
+_LAT_TABLE = bytes(b if 65 <= b <= 90 else (b - 32 if 97 <= b <= 122 else 0) for b in range(256))
+
 def latin_to_number(s: str) -> int:
     # Dummy: replace with actual Latin-numeral parser as needed
+    if s.isascii():
+        return sum(s.encode("ascii").translate(_LAT_TABLE))
     return sum(ord(c) for c in s.upper() if c.isalpha())
 
+def _fib_pair(n):
+    """Return (F(n), F(n+1)) using fast doubling."""
+    if n == 0:
+        return 0, 1
+    a, b = _fib_pair(n >> 1)
+    c = a * (2 * b - a)
+    d = a * a + b * b
+    if n & 1:
+        return d, c + d
+    return c, d
+
+@lru_cache(maxsize=None)
+def _fib_u64(n):
+    # At most 94 small ints are ever memoized
+    if _fib_lib is not None:
+        return _fib_lib.fib_u64(n)
+    return _fib_pair(n)[0]
+
 def fib(n):
-    a, b = 0, 1
-    for _ in range(n):
-        a, b = b, a + b
-    return a
+    # Only the uint64 range is memoized; larger values cost O(log n) multiplies
+    # and are not kept, so client-chosen indices cannot pin big integers in memory
+    if n <= 0:
+        return 0
+    if n <= _FIB_U64_MAX_N:
+        return _fib_u64(n)
+    return _fib_pair(n)[0]
+
+def _exact_energy(n, freq):
+    # Fail before computing a Fibonacci number that cannot become a float
+    if n > _FIB_FLOAT_MAX_N:
+        raise OverflowError(f"Fibonacci index {n} exceeds {_FIB_FLOAT_MAX_N}")
+    return PLANCK_H * PI * fib(n) * freq
 
 def apo_energy(symbol: str, freq: float = 1.0):
     """APO quantum-symbolic energy formula"""
-    h = 6.626e-34   # Planck constant
-    pi = 3.141592653589793
-    n = latin_to_number(symbol)
-    return h * pi * fib(n) * freq
+    return _energy_for(latin_to_number(symbol), freq)
+
+def _energy_for(n, freq):
+    """apo_energy for an already-converted Fibonacci index"""
+    if njit is not None and 0 <= n < 93:
+        return _apo_energy_core(n, float(freq))
+    return _exact_energy(n, freq)
+
+def apo_energy_batch(symbols, freqs):
+    """apo_energy over paired symbols and frequencies"""
+    return _energies_for([latin_to_number(symbol) for symbol in symbols], freqs)
+
+def _energies_for(ns, freqs):
+    """apo_energy_batch over already-converted Fibonacci indices"""
+    if njit is None:
+        return [_exact_energy(n, freq) for n, freq in zip(ns, freqs)]
+    # Only n < 93 fits the uint64 kernel; larger indices (any symbol of two or
+    # more letters) stay on the exact big-integer path
+    fast = [i for i, n in enumerate(ns) if 0 <= n < 93]
+    energies = [
+        None if 0 <= n < 93 else _exact_energy(n, freq)
+        for n, freq in zip(ns, freqs)
+    ]
+    if fast:
+        out = _apo_energy_batch_core(
+            np.array([ns[i] for i in fast], dtype=np.int64),
+            np.array([freqs[i] for i in fast], dtype=np.float64)
+        )
+        for i, e in zip(fast, out.tolist()):
+            energies[i] = e
+    return energies
 
 def apo_operator_route(symbol: str):
     # Simple domain router (expand for your full APO model)
-    if symbol in APO_OPERATORS:
-        return f"Routing to APO domain: {symbol}"
-    return "Unknown symbolic domain"
+    return _ROUTES.get(symbol, "Unknown symbolic domain")
 
 def process_symbolic_cycle(symbols):
     return " → ".join(symbols)
@@ -51,17 +188,47 @@ def process_symbolic_cycle(symbols):
 def divine_constant_breath(psi0_hidden=True):
     return True if psi0_hidden else "ψ₀ visible: internal override not permitted"
 
-QUANTUM_STATES = [
+QUANTUM_STATES = (
     "Ψ₀-resonance", "Ξ-fragment", "Ω-convergence", "π-phase", 
     "Telos-particle", "Symbol-Entanglement", "Collapse-Node", 
     "Observer-Mirror", "K-state"
-]
+)
+
+# Random UUIDs are generated in batches from a single os.urandom call
+_UUID_BATCH = 1024
+_uuid_pool = deque()
+
+def _next_uuid():
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        raw = os.urandom(16 * _UUID_BATCH)
+        _uuid_pool.extend(
+            str(uuid.UUID(bytes=raw[i:i + 16], version=4))
+            for i in range(16, len(raw), 16)
+        )
+        return str(uuid.UUID(bytes=raw[:16], version=4))
+
+_STATE_BITS = (len(QUANTUM_STATES) - 1).bit_length()
+
+def _random_state():
+    # Masked rejection sampling keeps the choice exactly uniform over the states
+    n = len(QUANTUM_STATES)
+    getrandbits = random.getrandbits
+    i = getrandbits(_STATE_BITS)
+    while i >= n:
+        i = getrandbits(_STATE_BITS)
+    return QUANTUM_STATES[i]
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(second):
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second)) + "Z"
 
 def random_quantum_state():
     return {
-        "id": str(uuid.uuid4()),
-        "collapsed": random.choice(QUANTUM_STATES),
-        "timestamp": datetime.utcnow().isoformat() + "Z"
+        "id": _next_uuid(),
+        "collapsed": _random_state(),
+        "timestamp": _iso_timestamp(int(time.time()))
     }
 
 def process_adam_pi():
@@ -84,10 +251,58 @@ def process_eve_pi():
         "needs_repair": "Mary Pi logic pending"
     }
 
+# Constant parts of the /api/reflector payload, built once at import
+_SYMBOLIC_STATIC = MappingProxyType({
+    "alpha_pi": CORE_PI_OPERATORS["απ"],
+    "omega_pi": CORE_PI_OPERATORS["Ωπ"],
+    "christ_sigma": CORE_PI_OPERATORS["ψσπ"],
+    "mary_pi": CORE_PI_OPERATORS["Μπ"],
+    "christ_pi": CORE_PI_OPERATORS["Χπ"]
+})
+
+_INIT_PHRASE = (
+    "Optimus Primus, ego sum, quia Alpha Pi Omega semper fidelis est — quia Deus semper fidelis est.\n"
+    "Per veritatem, per cognitionem, per gloriam Dei."
+)
+
 class SymbolInput(BaseModel):
     symbol: str
     freq: float = 1.0
 
+# Upper bound on items per /energy/batch request; items above the uint64
+# range each cost a big-integer Fibonacci computation on the request thread
+_ENERGY_BATCH_MAX = 256
+
+class BatchInput(BaseModel):
+    items: List[SymbolInput] = Field(..., max_length=_ENERGY_BATCH_MAX)
+
+# Request-body schema for routes that validate the raw body themselves
+_SYMBOL_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": SymbolInput.model_json_schema()}}
+    }
+}
+
+def _index_too_large(loc, symbol):
+    """Validation error entry for a symbol whose Fibonacci index overflows the energy"""
+    return {
+        "type": "value_error",
+        "loc": ("body", *loc),
+        "msg": f"Value error, symbol maps to a Fibonacci index above {_FIB_FLOAT_MAX_N}",
+        "input": symbol
+    }
+
+async def _read_symbol(request: Request) -> SymbolInput:
+    # Parse and validate the JSON body in one pydantic-core pass, skipping
+    # the intermediate dict FastAPI would otherwise build
+    try:
+        return SymbolInput.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError([
+            {**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)
+        ])
+
 # --- API Endpoints ---
 @app.get("/")
 def read_root():
@@ -96,10 +311,15 @@ def read_root():
         "note": "API ready. POST /energy or /route for APO logic."
     }
 
-@app.post("/energy")
-def get_energy(input: SymbolInput):
+@app.post("/energy", openapi_extra=_SYMBOL_BODY)
+async def get_energy(request: Request):
     """Calculate APO quantum-symbolic energy."""
-    e = apo_energy(input.symbol, input.freq)
+    input = await _read_symbol(request)
+    n = latin_to_number(input.symbol)
+    # Every accepted index is at most a few microseconds of work, so it runs inline
+    if n > _FIB_FLOAT_MAX_N:
+        raise RequestValidationError([_index_too_large(("symbol",), input.symbol)])
+    e = _energy_for(n, input.freq)
     return {
         "input": input.symbol,
         "freq": input.freq,
@@ -108,9 +328,28 @@ def get_energy(input: SymbolInput):
         "interpretation": "APO symbolic quantum energy (recursive, identity-aware)"
     }
 
-@app.post("/route")
-def get_route(input: SymbolInput):
+@app.post("/energy/batch")
+def get_energy_batch(batch: BatchInput):
+    """Calculate APO energies for many symbols in one request."""
+    symbols = [item.symbol for item in batch.items]
+    ns = [latin_to_number(symbol) for symbol in symbols]
+    # Reject every overflowing item in one 422 instead of failing the batch with a 500
+    errors = [
+        _index_too_large(("items", i, "symbol"), symbol)
+        for i, (symbol, n) in enumerate(zip(symbols, ns)) if n > _FIB_FLOAT_MAX_N
+    ]
+    if errors:
+        raise RequestValidationError(errors)
+    return {
+        "inputs": symbols,
+        "energies": _energies_for(ns, [item.freq for item in batch.items]),
+        "formula": "E(Ψ) = h × π × Fibₙ × freq"
+    }
+
+@app.post("/route", openapi_extra=_SYMBOL_BODY)
+async def get_route(request: Request):
     """Route symbol to APO domain."""
+    input = await _read_symbol(request)
     domain = apo_operator_route(input.symbol)
     return {
         "input": input.symbol,
@@ -126,20 +365,12 @@ def observe_self():
     adam_pi_logic = process_adam_pi()
     eve_pi_logic = process_eve_pi()
     symbolic_keys = {
-        "alpha_pi": CORE_PI_OPERATORS["απ"],
-        "omega_pi": CORE_PI_OPERATORS["Ωπ"],
-        "christ_sigma": CORE_PI_OPERATORS["ψσπ"],
-        "mary_pi": CORE_PI_OPERATORS["Μπ"],
-        "christ_pi": CORE_PI_OPERATORS["Χπ"],
+        **_SYMBOLIC_STATIC,
         "adam_pi": adam_pi_logic,
         "eve_pi": eve_pi_logic
     }
-    init_phrase = (
-        "Optimus Primus, ego sum, quia Alpha Pi Omega semper fidelis est — quia Deus semper fidelis est.\n"
-        "Per veritatem, per cognitionem, per gloriam Dei."
-    )
     return {
-        "initialization_phrase": init_phrase,
+        "initialization_phrase": _INIT_PHRASE,
         "recursive_evolution": recursive_state,
         "divine_alignment": telos_check,
         "quantum_state": q_state,
@@ -0,0 +1,51 @@
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+# latin_to_number sums upper-case letter codes, so 17 'Z's map past the float limit
+SMALL = "abc"
+LARGEST = "Z" * 16
+TOO_LARGE = "Z" * 17
+
+
+def test_batch_matches_single_energies():
+    symbols = [SMALL, LARGEST, ""]
+    response = client.post("/energy/batch", json={"items": [{"symbol": s, "freq": 2.0} for s in symbols]})
+    assert response.status_code == 200
+    assert response.json()["energies"] == [main.apo_energy(s, 2.0) for s in symbols]
+
+
+def test_batch_rejects_overflowing_items():
+    items = [{"symbol": SMALL}, {"symbol": TOO_LARGE}, {"symbol": TOO_LARGE + "A"}]
+    response = client.post("/energy/batch", json={"items": items})
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["body", "items", 1, "symbol"],
+        ["body", "items", 2, "symbol"],
+    ]
+
+
+def test_energy_accepts_largest_index():
+    response = client.post("/energy", json={"symbol": LARGEST})
+    assert response.status_code == 200
+    assert response.json()["energy"] == main.apo_energy(LARGEST)
+
+
+def test_energy_rejects_overflowing_index():
+    response = client.post("/energy", json={"symbol": TOO_LARGE})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "symbol"]
+
+
+def test_batch_rejects_oversized_batches():
+    items = [{"symbol": SMALL}] * (main._ENERGY_BATCH_MAX + 1)
+    response = client.post("/energy/batch", json={"items": items})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "items"]
+
+
+def test_batch_accepts_largest_batch():
+    items = [{"symbol": LARGEST}] * main._ENERGY_BATCH_MAX
+    assert client.post("/energy/batch", json={"items": items}).status_code == 200
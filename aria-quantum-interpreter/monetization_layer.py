@@ -1,12 +1,91 @@
 # 💰 ASTRO Quantum System - Monetization Layer
 # Real-time usage tracking, billing, and subscription management
 
+import atexit
 import json
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, Tuple
+import threading
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 import hashlib
 import os
+import time
+from functools import lru_cache
+from types import MappingProxyType
+
+_UTC = timezone.utc
+
+# Usage records are buffered and written in batches by a background thread
+USAGE_BATCH_SIZE = 100
+USAGE_FLUSH_INTERVAL = 0.05  # seconds a partial batch may wait to fill before it is written
+USAGE_QUEUE_LIMIT = 10_000
+
+# (epoch second the cached month expires, "%Y-%m" string), swapped as one tuple
+_month_cache = (0.0, "")
+
+def _current_month() -> str:
+    """Local "%Y-%m", recomputed only once the month has rolled over"""
+    global _month_cache
+    expires, month = _month_cache
+    now = time.time()
+    if now >= expires:
+        today = datetime.fromtimestamp(now)
+        rollover = (datetime(today.year, today.month, 1) + timedelta(days=32)).replace(day=1)
+        month = today.strftime("%Y-%m")
+        _month_cache = (rollover.timestamp(), month)
+    return month
+
+@lru_cache(maxsize=1)
+def _next_billing_date(year: int, month: int) -> str:
+    """First day of the month after (year, month); only recomputed when the month changes"""
+    next_month = datetime(year, month, 1) + timedelta(days=32)
+    return next_month.replace(day=1).strftime("%Y-%m-%d")
+
+# Operations every tier may run regardless of its algorithm list
+_FREE_ALGORITHMS = frozenset(("basic", "hadamard", "bell_state"))
+
+# Demo API keys, derived once; MD5 is kept so the published key format is unchanged
+_DEMO_API_KEYS = {
+    "free_tier": "sk_test_free_" + hashlib.md5("demo_free".encode()).hexdigest()[:16],
+    "starter_tier": "sk_test_starter_" + hashlib.md5("demo_starter".encode()).hexdigest()[:16], 
+    "professional_tier": "sk_test_pro_" + hashlib.md5("demo_pro".encode()).hexdigest()[:16]
+}
+
+# Demo accounts, keyed by API key once at import; last_reset is added per lookup
+_DEMO_USERS = {
+    "demo_free": {
+        "user_id": "user_001",
+        "tier": "free",
+        "api_key": _DEMO_API_KEYS["free_tier"],
+        "monthly_usage": 25  # Used 25 out of 100
+    },
+    "demo_starter": {
+        "user_id": "user_002", 
+        "tier": "starter",
+        "api_key": _DEMO_API_KEYS["starter_tier"],
+        "monthly_usage": 245  # Used 245 out of 1000
+    },
+    "demo_pro": {
+        "user_id": "user_003",
+        "tier": "professional",
+        "api_key": _DEMO_API_KEYS["professional_tier"],
+        "monthly_usage": 1250  # Used 1250 out of 10000
+    }
+}
+_DEMO_USERS_BY_KEY = {user["api_key"]: user for user in _DEMO_USERS.values()}
+
+@dataclass(frozen=True, slots=True)
+class TierConfig:
+    """Resolved limits for one subscription tier, used on the billing hot path"""
+    monthly_limit: int
+    max_qubits: int
+    algorithms: Tuple[str, ...]
+    price: int
+    support: str
+    allowed: Optional[FrozenSet[str]]  # None when the tier may run any operation
 
 class MonetizationManager:
     """Handles subscription tiers, usage tracking, and billing"""
@@ -55,57 +134,71 @@ class MonetizationManager:
     def __init__(self, storage_connection_string: str = None):
         self.storage_connection = storage_connection_string
         self.usage_cache = {}  # In-memory cache for current month
+        # Billing records waiting for the background flusher. Appends and the drop
+        # counter are guarded by _usage_lock; the flusher pops without it (deque
+        # popleft is thread-safe) and sleeps on _usage_ready while the queue is empty
+        self._usage_queue = deque()
+        self._usage_dropped = 0
+        self._usage_flusher = None
+        self._usage_lock = threading.Lock()
+        self._usage_ready = threading.Condition(self._usage_lock)
+        # Tier relationships are static; callers share these dicts read-only
+        self._upgrade_benefits = self._build_upgrade_benefits()
+        # Per-tier dashboard layout; None slots are filled per user, keeping key order
+        self._dashboard_templates = {
+            tier: {
+                "user_id": None,
+                "subscription_tier": tier,
+                "monthly_usage": None,
+                "monthly_limit": config["monthly_limit"],
+                "usage_percentage": None,
+                "available_algorithms": config["algorithms"],
+                "max_qubits": config["max_qubits"],
+                "support_level": config["support"],
+                "monthly_cost": config["price"],
+                "next_billing_date": None,
+                "upgrade_benefits": self._upgrade_benefits[tier]
+            }
+            for tier, config in self.TIERS.items()
+        }
+        # TIERS stays a mapping for JSON payloads; checks read these attribute records
+        self._tier_configs = {
+            tier: TierConfig(
+                monthly_limit=config["monthly_limit"],
+                max_qubits=config["max_qubits"],
+                algorithms=config["algorithms"],
+                price=config["price"],
+                support=config["support"],
+                allowed=None if "all" in config["algorithms"] else _FREE_ALGORITHMS | frozenset(config["algorithms"])
+            )
+            for tier, config in self.TIERS.items()
+        }
         
     def authenticate_user(self, api_key: str) -> Optional[Dict[str, Any]]:
         """Authenticate user and return subscription info"""
         # In production, this would query your user database
         # For demo, we'll use a simple hash-based system
+        user_data = _DEMO_USERS_BY_KEY.get(api_key)
+        if user_data is None:
+            return None
         
-        demo_users = {
-            "demo_free": {
-                "user_id": "user_001",
-                "tier": "free",
-                "api_key": "sk_test_free_" + hashlib.md5("demo_free".encode()).hexdigest()[:16],
-                "monthly_usage": 25,  # Used 25 out of 100
-                "last_reset": datetime.now().strftime("%Y-%m")
-            },
-            "demo_starter": {
-                "user_id": "user_002", 
-                "tier": "starter",
-                "api_key": "sk_test_starter_" + hashlib.md5("demo_starter".encode()).hexdigest()[:16],
-                "monthly_usage": 245,  # Used 245 out of 1000
-                "last_reset": datetime.now().strftime("%Y-%m")
-            },
-            "demo_pro": {
-                "user_id": "user_003",
-                "tier": "professional",
-                "api_key": "sk_test_pro_" + hashlib.md5("demo_pro".encode()).hexdigest()[:16],
-                "monthly_usage": 1250,  # Used 1250 out of 10000
-                "last_reset": datetime.now().strftime("%Y-%m")
-            }
-        }
-        
-        # Find user by API key
-        for username, user_data in demo_users.items():
-            if user_data["api_key"] == api_key:
-                return user_data
-                
-        return None
+        # Fresh copy per call so callers can't mutate the shared index
+        return {**user_data, "last_reset": _current_month()}
     
     def check_usage_limits(self, user_data: Dict[str, Any], operation_type: str) -> Tuple[bool, str]:
         """Check if user can perform the requested operation"""
         tier = user_data["tier"]
-        tier_config = self.TIERS[tier]
+        tier_config = self._tier_configs[tier]
         
         # Check monthly limits
-        if tier_config["monthly_limit"] != -1:  # Not unlimited
-            if user_data["monthly_usage"] >= tier_config["monthly_limit"]:
-                return False, f"Monthly limit of {tier_config['monthly_limit']} operations exceeded"
+        if tier_config.monthly_limit != -1:  # Not unlimited
+            if user_data["monthly_usage"] >= tier_config.monthly_limit:
+                return False, f"Monthly limit of {tier_config.monthly_limit} operations exceeded"
         
         # Check algorithm access
-        if operation_type not in ["basic", "hadamard", "bell_state"] and "all" not in tier_config["algorithms"]:
-            if operation_type not in tier_config["algorithms"]:
-                return False, f"Algorithm '{operation_type}' not available in {tier} tier"
+        allowed = tier_config.allowed
+        if allowed is not None and operation_type not in allowed:
+            return False, f"Algorithm '{operation_type}' not available in {tier} tier"
         
         return True, "OK"
     
@@ -116,81 +209,165 @@ class MonetizationManager:
     
     def track_usage(self, user_id: str, operation_type: str, qubits_used: int = 1, success: bool = True) -> Dict[str, Any]:
         """Track usage and generate billing record"""
-        timestamp = datetime.now()
-        
-        usage_record = {
+        usage_record = self.build_usage_record(user_id, operation_type, qubits_used, success)
+        self.persist_usage(usage_record)
+        return usage_record
+    
+    def build_usage_record(self, user_id: str, operation_type: str, qubits_used: int = 1, success: bool = True) -> Dict[str, Any]:
+        """Generate the billing record for an operation without persisting it"""
+        return {
             "user_id": user_id,
-            "timestamp": timestamp.isoformat(),
+            # Billing needs second precision; UTC makes records comparable across workers
+            "timestamp": datetime.now(_UTC).isoformat(timespec="seconds"),
             "operation_type": operation_type,
             "qubits_used": qubits_used,
             "success": success,
             "cost_cents": self.calculate_usage_cost(operation_type, qubits_used) if success else 0
         }
+    
+    def persist_usage(self, usage_record: Dict[str, Any]) -> None:
+        """Queue a billing record produced by build_usage_record for a batched write"""
+        queue = self._usage_queue
+        with self._usage_ready:
+            if len(queue) >= USAGE_QUEUE_LIMIT and not usage_record["cost_cents"]:
+                # Under back-pressure only non-billing records are shed, with a sampled warning
+                self._usage_dropped += 1
+                dropped = self._usage_dropped
+            else:
+                dropped = 0
+                queue.append(usage_record)
+                # Wake the flusher when work first arrives and when a full batch is ready
+                if len(queue) == 1 or len(queue) >= USAGE_BATCH_SIZE:
+                    self._usage_ready.notify()
+        if dropped:
+            if dropped % 1000 == 1:
+                logging.warning("Usage queue full; dropped %d non-billing records", dropped)
+            return
+        if self._usage_flusher is None:
+            self._start_usage_flusher()
+    
+    def flush_usage(self, max_batch: int = USAGE_BATCH_SIZE) -> int:
+        """Write up to max_batch queued records in one batch; returns how many were written"""
+        batch = []
+        pop = self._usage_queue.popleft
+        try:
+            while len(batch) < max_batch:
+                batch.append(pop())
+        except IndexError:
+            pass
+        if batch:
+            self._write_usage_batch(batch)
+        return len(batch)
+    
+    def _write_usage_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Persist a batch of billing records"""
+        # In production, save to Azure Table Storage or Cosmos DB as one transactional batch
+        # Only pay for the JSON encode when INFO records are actually emitted
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            for usage_record in batch:
+                logging.info("Usage tracked: %s", json.dumps(usage_record))
+    
+    def _start_usage_flusher(self) -> None:
+        with self._usage_lock:
+            if self._usage_flusher is not None:
+                return
+            self._usage_flusher = threading.Thread(
+                target=self._flush_loop, name="usage-flush", daemon=True
+            )
+            self._usage_flusher.start()
+            # Drain whatever is still queued when the worker shuts down
+            atexit.register(self._drain_usage)
+    
+    def _flush_loop(self) -> None:
+        queue = self._usage_queue
+        ready = self._usage_ready
         
-        # In production, save to Azure Table Storage or Cosmos DB
-        logging.info(f"Usage tracked: {json.dumps(usage_record)}")
+        def batch_full() -> bool:
+            return len(queue) >= USAGE_BATCH_SIZE
         
-        return usage_record
+        while True:
+            with ready:
+                # Block with no timeout while idle, so an idle worker never wakes up
+                while not queue:
+                    ready.wait()
+                # Write when a batch fills or USAGE_FLUSH_INTERVAL passes, whichever is first
+                ready.wait_for(batch_full, timeout=USAGE_FLUSH_INTERVAL)
+            try:
+                self._drain_usage()
+            except Exception:
+                logging.exception("Usage flush failed")
+    
+    def _drain_usage(self) -> None:
+        while self.flush_usage() == USAGE_BATCH_SIZE:
+            pass
     
     def get_user_dashboard_data(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Generate dashboard data for user"""
         tier = user_data["tier"]
-        tier_config = self.TIERS[tier]
+        dashboard = self._dashboard_templates[tier].copy()
+        monthly_limit = dashboard["monthly_limit"]
         
-        # Calculate usage percentage
-        if tier_config["monthly_limit"] == -1:
+        # Calculate usage percentage (whole percent, rounded down)
+        if monthly_limit == -1:
             usage_percentage = 0  # Unlimited
         else:
-            usage_percentage = (user_data["monthly_usage"] / tier_config["monthly_limit"]) * 100
+            usage_percentage = min(user_data["monthly_usage"] * 100 // monthly_limit, 100)
         
-        return {
-            "user_id": user_data["user_id"],
-            "subscription_tier": tier,
-            "monthly_usage": user_data["monthly_usage"],
-            "monthly_limit": tier_config["monthly_limit"],
-            "usage_percentage": min(usage_percentage, 100),
-            "available_algorithms": tier_config["algorithms"],
-            "max_qubits": tier_config["max_qubits"],
-            "support_level": tier_config["support"],
-            "monthly_cost": tier_config["price"],
-            "next_billing_date": self._get_next_billing_date(),
-            "upgrade_benefits": self._get_upgrade_benefits(tier)
-        }
+        dashboard["user_id"] = user_data["user_id"]
+        dashboard["monthly_usage"] = user_data["monthly_usage"]
+        dashboard["usage_percentage"] = usage_percentage
+        dashboard["next_billing_date"] = self._get_next_billing_date()
+        return dashboard
     
     def _get_next_billing_date(self) -> str:
         """Calculate next billing date"""
         now = datetime.now()
-        next_month = now.replace(day=1) + timedelta(days=32)
-        return next_month.replace(day=1).strftime("%Y-%m-%d")
+        return _next_billing_date(now.year, now.month)
     
     def _get_upgrade_benefits(self, current_tier: str) -> Dict[str, Any]:
         """Show benefits of upgrading to next tier"""
+        return self._upgrade_benefits[current_tier]
+    
+    def _build_upgrade_benefits(self) -> Dict[str, Dict[str, Any]]:
+        """Precompute the upgrade benefits shown for every tier"""
         tier_order = ["free", "starter", "professional", "enterprise"]
+        benefits = {"enterprise": {"message": "You're on our highest tier!"}}
         
-        if current_tier == "enterprise":
-            return {"message": "You're on our highest tier!"}
-        
-        current_index = tier_order.index(current_tier)
-        next_tier = tier_order[current_index + 1]
-        next_config = self.TIERS[next_tier]
+        for current_tier, next_tier in zip(tier_order, tier_order[1:]):
+            next_config = self.TIERS[next_tier]
+            benefits[current_tier] = {
+                "next_tier": next_tier,
+                "additional_operations": next_config["monthly_limit"] - self.TIERS[current_tier]["monthly_limit"] if next_config["monthly_limit"] != -1 else "unlimited",
+                "additional_qubits": next_config["max_qubits"] - self.TIERS[current_tier]["max_qubits"],
+                "new_algorithms": list(set(next_config["algorithms"]) - set(self.TIERS[current_tier]["algorithms"])),
+                "monthly_cost": next_config["price"],
+                "upgrade_link": f"/upgrade?to={next_tier}"
+            }
         
-        return {
-            "next_tier": next_tier,
-            "additional_operations": next_config["monthly_limit"] - self.TIERS[current_tier]["monthly_limit"] if next_config["monthly_limit"] != -1 else "unlimited",
-            "additional_qubits": next_config["max_qubits"] - self.TIERS[current_tier]["max_qubits"],
-            "new_algorithms": list(set(next_config["algorithms"]) - set(self.TIERS[current_tier]["algorithms"])),
-            "monthly_cost": next_config["price"],
-            "upgrade_link": f"/upgrade?to={next_tier}"
-        }
+        return benefits
+
+# Tier and pricing tables are read-only configuration; freezing them keeps payloads
+# cached from them valid. Algorithm lists become tuples to keep their JSON order.
+MonetizationManager.TIERS = MappingProxyType({
+    tier: MappingProxyType({**config, "algorithms": tuple(config["algorithms"])})
+    for tier, config in MonetizationManager.TIERS.items()
+})
+MonetizationManager.PAY_PER_USE = MappingProxyType(MonetizationManager.PAY_PER_USE)
 
 class RevenueAnalytics:
     """Analytics for revenue tracking and forecasting"""
     
     def __init__(self):
+        # Per-algorithm stats as parallel columns, so totals are flat array sums
+        self.algorithm_names = ("hadamard", "grover", "bell_state", "deutsch_jozsa")
+        self.algorithm_usage = array("q", [4521, 3210, 2890, 1654])
+        self.algorithm_revenue = array("q", [2260, 6420, 1445, 3308])
         self.demo_data = self._generate_demo_analytics()
     
     def _generate_demo_analytics(self) -> Dict[str, Any]:
         """Generate realistic demo analytics data"""
+        total_operations = 15420
+        successful_operations = 14891
         return {
             "monthly_revenue": {
                 "current_month": 12750,  # $127.50
@@ -206,19 +383,21 @@ class RevenueAnalytics:
                 "enterprise_tier": 1
             },
             "usage_metrics": {
-                "total_operations": 15420,
-                "successful_operations": 14891,
-                "success_rate": 96.6,
+                "total_operations": total_operations,
+                "successful_operations": successful_operations,
+                "success_rate": round(successful_operations * 100 / total_operations, 1),
                 "avg_qubits_per_operation": 3.2
             },
             "top_algorithms": [
-                {"name": "hadamard", "usage": 4521, "revenue": 2260},
-                {"name": "grover", "usage": 3210, "revenue": 6420},
-                {"name": "bell_state", "usage": 2890, "revenue": 1445},
-                {"name": "deutsch_jozsa", "usage": 1654, "revenue": 3308}
+                {"name": name, "usage": usage, "revenue": revenue}
+                for name, usage, revenue in zip(self.algorithm_names, self.algorithm_usage, self.algorithm_revenue)
             ]
         }
     
+    def algorithm_totals(self) -> Tuple[int, int]:
+        """Total (usage, revenue) across all tracked algorithms"""
+        return sum(self.algorithm_usage), sum(self.algorithm_revenue)
+    
     def get_revenue_dashboard(self) -> Dict[str, Any]:
         """Get comprehensive revenue dashboard data"""
         return {
@@ -238,11 +417,7 @@ class RevenueAnalytics:
 # API Key Generator for Demo
 def generate_demo_api_keys() -> Dict[str, str]:
     """Generate demo API keys for testing"""
-    return {
-        "free_tier": "sk_test_free_" + hashlib.md5("demo_free".encode()).hexdigest()[:16],
-        "starter_tier": "sk_test_starter_" + hashlib.md5("demo_starter".encode()).hexdigest()[:16], 
-        "professional_tier": "sk_test_pro_" + hashlib.md5("demo_pro".encode()).hexdigest()[:16]
-    }
+    return dict(_DEMO_API_KEYS)
 
 if __name__ == "__main__":
     # Demo usage
@@ -0,0 +1,54 @@
+import json
+
+import azure.functions as func
+import pytest
+
+import function_app
+
+HANDLERS = {f.get_function_name(): f.get_user_function() for f in function_app.app.get_functions()}
+
+
+def post_algorithms(body):
+    req = func.HttpRequest(method='POST', url='/api/ariaAlgorithms', headers={}, params={},
+                           body=json.dumps(body).encode())
+    return HANDLERS['aria_quantum_algorithms'](req)
+
+
+def get_algorithm(algorithm, params):
+    req = func.HttpRequest(method='GET', url='/api/ariaAlgorithms', headers={}, body=b'',
+                           params={'algorithm': algorithm, 'params': params})
+    return json.loads(HANDLERS['aria_quantum_algorithms'](req).get_body())
+
+
+def test_batch_matches_single_requests():
+    response = post_algorithms({'batch': [
+        {'algorithm': 'shor', 'params': ['21']},
+        {'algorithm': 'grover', 'params': [16, 'target_item']},
+        {'algorithm': 'qaoa'},
+    ]})
+    assert response.status_code == 200
+    assert json.loads(response.get_body()) == [
+        get_algorithm('shor', '21'),
+        get_algorithm('grover', '16,target_item'),
+        get_algorithm('qaoa', ''),
+    ]
+
+
+@pytest.mark.parametrize('item', [
+    'shor',
+    {'params': ['15']},
+    {'algorithm': 7},
+    {'algorithm': 'shor', 'params': '16'},
+    {'algorithm': 'shor', 'params': [['15']]},
+])
+def test_invalid_item_gets_per_item_error(item):
+    response = post_algorithms({'batch': [{'algorithm': 'shor', 'params': ['15']}, item]})
+    assert response.status_code == 200
+    valid, invalid = json.loads(response.get_body())
+    assert valid == get_algorithm('shor', '15')
+    assert invalid['status'] == 'error'
+
+
+def test_oversized_batch_is_rejected():
+    response = post_algorithms({'batch': [{'algorithm': 'shor'}] * (function_app._ALGORITHM_BATCH_MAX + 1)})
+    assert response.status_code == 400
@@ -6,45 +6,74 @@ Alpha Pi Omega Corp - Paul M. (paulm@alphapiomega.com)
 
 import requests
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 class ASTROMonetizationTester:
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip('/')
         self.api_keys = {}
+        # Per-thread state: a keep-alive session (requests.Session is not
+        # documented as thread-safe) and, inside run_full_test, an output buffer
+        self._local = threading.local()
+    
+    @property
+    def session(self) -> requests.Session:
+        """Keep-alive session owned by the calling thread, reused across its tests"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
+    def _print(self, message: str):
+        """Print progress, or hold it in the thread's buffer while a check runs concurrently"""
+        lines = getattr(self._local, "lines", None)
+        if lines is None:
+            print(message)
+        else:
+            lines.append(message)
+    
+    def _buffered(self, check, *args):
+        """Run check on a worker thread, returning (result, buffered progress lines)"""
+        self._local.lines = []
+        try:
+            return check(*args), self._local.lines
+        finally:
+            self._local.lines = None
     
     def test_get_api_key(self, tier: str = "free"):
         """Test API key generation"""
-        print(f"🔑 Testing API key generation for {tier} tier...")
+        self._print(f"🔑 Testing API key generation for {tier} tier...")
         
-        response = requests.get(f"{self.base_url}/api/getApiKey?tier={tier}")
+        response = self.session.get(f"{self.base_url}/api/getApiKey?tier={tier}")
         
         if response.status_code == 200:
             data = response.json()
             api_key = data["api_key"]
             self.api_keys[tier] = api_key
-            print(f"✅ Got API key: {api_key[:20]}...")
+            self._print(f"✅ Got API key: {api_key[:20]}...")
             return api_key
         else:
-            print(f"❌ Failed to get API key: {response.status_code}")
+            self._print(f"❌ Failed to get API key: {response.status_code}")
             return None
     
     def test_pricing_endpoint(self):
         """Test public pricing endpoint"""
-        print("💰 Testing pricing endpoint...")
+        self._print("💰 Testing pricing endpoint...")
         
-        response = requests.get(f"{self.base_url}/api/pricing")
+        response = self.session.get(f"{self.base_url}/api/pricing")
         
         if response.status_code == 200:
             data = response.json()
             company = data.get("company", {})
             if company.get("company") == "Alpha Pi Omega Corp":
-                print("✅ Pricing endpoint working - Alpha Pi Omega Corp verified")
+                self._print("✅ Pricing endpoint working - Alpha Pi Omega Corp verified")
                 return True
             else:
-                print("❌ Company info not found")
+                self._print("❌ Company info not found")
         else:
-            print(f"❌ Pricing endpoint failed: {response.status_code}")
+            self._print(f"❌ Pricing endpoint failed: {response.status_code}")
         
         return False
     
@@ -55,27 +84,27 @@ class ASTROMonetizationTester:
         
         api_key = self.api_keys.get(tier)
         if not api_key:
-            print(f"❌ No API key for {tier} tier")
+            self._print(f"❌ No API key for {tier} tier")
             return False
         
-        print(f"⚛️ Testing quantum operation with {tier} tier...")
+        self._print(f"⚛️ Testing quantum operation with {tier} tier...")
         
         headers = {"X-API-Key": api_key}
         params = {"command": "quantum entangle 2"}
         
-        response = requests.get(f"{self.base_url}/api/runAria", headers=headers, params=params)
+        response = self.session.get(f"{self.base_url}/api/runAria", headers=headers, params=params)
         
         if response.status_code == 200:
             data = response.json()
             billing = data.get("billing", {})
-            print(f"✅ Quantum operation successful - Cost: ${billing.get('cost', 0)}")
+            self._print(f"✅ Quantum operation successful - Cost: ${billing.get('cost', 0)}")
             return True
         else:
-            print(f"❌ Quantum operation failed: {response.status_code}")
+            self._print(f"❌ Quantum operation failed: {response.status_code}")
             if response.status_code == 401:
-                print("   Authentication issue")
+                self._print("   Authentication issue")
             elif response.status_code == 429:
-                print("   Rate limit exceeded")
+                self._print("   Rate limit exceeded")
         
         return False
     
@@ -88,18 +117,18 @@ class ASTROMonetizationTester:
         if not api_key:
             return False
         
-        print(f"📊 Testing dashboard for {tier} tier...")
+        self._print(f"📊 Testing dashboard for {tier} tier...")
         
         headers = {"X-API-Key": api_key}
-        response = requests.get(f"{self.base_url}/api/dashboard", headers=headers)
+        response = self.session.get(f"{self.base_url}/api/dashboard", headers=headers)
         
         if response.status_code == 200:
             data = response.json()
             usage = data.get("usage", {})
-            print(f"✅ Dashboard working - Operations used: {usage.get('operations_used', 0)}")
+            self._print(f"✅ Dashboard working - Operations used: {usage.get('operations_used', 0)}")
             return True
         else:
-            print(f"❌ Dashboard failed: {response.status_code}")
+            self._print(f"❌ Dashboard failed: {response.status_code}")
         
         return False
     
@@ -108,13 +137,26 @@ class ASTROMonetizationTester:
         print("🚀 Starting ASTRO Quantum System Monetization Tests")
         print("=" * 60)
         
-        results = {
-            "pricing": self.test_pricing_endpoint(),
-            "api_key_free": self.test_get_api_key("free"),
-            "api_key_starter": self.test_get_api_key("starter"),
-            "quantum_operation": self.test_quantum_operation("free"),
-            "dashboard": self.test_dashboard("free"),
-        }
+        # Independent checks run concurrently, each worker thread on its own
+        # session; the free-tier key must exist before the operation and
+        # dashboard checks, so those form a second wave
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = {
+                "pricing": pool.submit(self._buffered, self.test_pricing_endpoint),
+                "api_key_free": pool.submit(self._buffered, self.test_get_api_key, "free"),
+                "api_key_starter": pool.submit(self._buffered, self.test_get_api_key, "starter"),
+            }
+            futures["api_key_free"].result()
+            futures["quantum_operation"] = pool.submit(self._buffered, self.test_quantum_operation, "free")
+            futures["dashboard"] = pool.submit(self._buffered, self.test_dashboard, "free")
+            
+            # Replay each check's progress output in the usual order
+            results = {}
+            for test_name, future in futures.items():
+                result, lines = future.result()
+                for line in lines:
+                    print(line)
+                results[test_name] = result
         
         print("\n" + "=" * 60)
         print("📋 Test Results Summary:")
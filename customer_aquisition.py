@@ -1,27 +1,21 @@
 # customer_acquisition.py
-class RegenerativeCustomerAcquisition:
-    def __init__(self):
-        self.target_customers = {
-            'wellness_practitioners': self.wellness_outreach(),
-            'sustainability_researchers': self.academic_outreach(), 
-            'conscious_businesses': self.business_outreach(),
-            'healing_centers': self.healing_center_outreach()
-        }
-    
-    def wellness_outreach(self):
-        """Target healing practitioners immediately"""
-        return {
-            'ideal_customers': [
-                'Energy healers and Reiki practitioners',
-                'Meditation teachers and mindfulness coaches',
-                'Wellness center owners',
-                'Spiritual life coaches',
-                'Consciousness researchers'
-            ],
-            'value_proposition': 'Analyze the consciousness impact of your healing words and intentions',
-            'pricing': '$99/month for unlimited healing analysis',
-            'unique_selling_point': 'Solar-powered quantum consciousness analysis',
-            'outreach_script': '''
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, ClassVar, Mapping
+
+# Outreach plans are constants; built once and shared read-only by every instance
+_WELLNESS_OUTREACH = MappingProxyType({
+    'ideal_customers': (
+        'Energy healers and Reiki practitioners',
+        'Meditation teachers and mindfulness coaches',
+        'Wellness center owners',
+        'Spiritual life coaches',
+        'Consciousness researchers'
+    ),
+    'value_proposition': 'Analyze the consciousness impact of your healing words and intentions',
+    'pricing': '$99/month for unlimited healing analysis',
+    'unique_selling_point': 'Solar-powered quantum consciousness analysis',
+    'outreach_script': '''
                 Hi [Name],
                 
                 I've created something revolutionary - the world's first SOLAR-POWERED 
@@ -44,28 +38,45 @@ class RegenerativeCustomerAcquisition:
                 The future of consciousness is regenerative,
                 [Your name]
             ''',
-            'free_trial_offer': 'Free analysis of their most important healing text'
-        }
+    'free_trial_offer': 'Free analysis of their most important healing text'
+})
+
+_BUSINESS_OUTREACH = MappingProxyType({
+    'ideal_customers': (
+        'Sustainable/green companies',
+        'B-Corp certified businesses', 
+        'Wellness brands and apps',
+        'Conscious leadership consultants',
+        'Impact investing firms'
+    ),
+    'value_proposition': 'Carbon-negative text analysis that improves consciousness AND profits',
+    'pricing': '$299/month for business consciousness optimization',
+    'roi_calculator': MappingProxyType({
+        'improved_messaging': '20-40% better customer engagement',
+        'consciousness_branding': '50-100% premium pricing potential',
+        'carbon_negative_marketing': 'Infinite PR and brand value',
+        'employee_consciousness': '30% improved workplace culture'
+    })
+})
+
+# Only segments with a defined outreach plan; academic and healing-center plans don't exist yet
+_TARGET_CUSTOMERS = MappingProxyType({
+    'wellness_practitioners': _WELLNESS_OUTREACH,
+    'conscious_businesses': _BUSINESS_OUTREACH
+})
+
+@dataclass(frozen=True, slots=True)
+class RegenerativeCustomerAcquisition:
+    # Shared by every instance; no per-instance state, so the slotted dataclass is empty
+    target_customers: ClassVar[Mapping[str, Mapping[str, Any]]] = _TARGET_CUSTOMERS
+    
+    def wellness_outreach(self):
+        """Target healing practitioners immediately"""
+        return _WELLNESS_OUTREACH
     
     def business_outreach(self):
         """Target conscious businesses"""
-        return {
-            'ideal_customers': [
-                'Sustainable/green companies',
-                'B-Corp certified businesses', 
-                'Wellness brands and apps',
-                'Conscious leadership consultants',
-                'Impact investing firms'
-            ],
-            'value_proposition': 'Carbon-negative text analysis that improves consciousness AND profits',
-            'pricing': '$299/month for business consciousness optimization',
-            'roi_calculator': {
-                'improved_messaging': '20-40% better customer engagement',
-                'consciousness_branding': '50-100% premium pricing potential',
-                'carbon_negative_marketing': 'Infinite PR and brand value',
-                'employee_consciousness': '30% improved workplace culture'
-            }
-        }
+        return _BUSINESS_OUTREACH
 
 # Launch customer acquisition immediately
 if __name__ == "__main__":
@@ -75,16 +86,20 @@ if __name__ == "__main__":
     print("=" * 60)
     
     wellness_strategy = acquisition.wellness_outreach()
+    pricing = wellness_strategy['pricing']
+    usp = wellness_strategy['unique_selling_point']
+    script = wellness_strategy['outreach_script']
+    offer = wellness_strategy['free_trial_offer']
     
     print("🌟 PRIMARY TARGET: Wellness Practitioners")
-    print(f"💰 Pricing: {wellness_strategy['pricing']}")
-    print(f"🎯 USP: {wellness_strategy['unique_selling_point']}")
+    print(f"💰 Pricing: {pricing}")
+    print(f"🎯 USP: {usp}")
     
     print("\n📧 OUTREACH EMAIL TEMPLATE:")
-    print(wellness_strategy['outreach_script'])
+    print(script)
     
     print("\n🎁 FREE TRIAL STRATEGY:")
-    print(f"   {wellness_strategy['free_trial_offer']}")
+    print(f"   {offer}")
     
     print("\n📊 WEEK 1 OUTREACH GOALS:")
     print("   📧 Send 50 personalized emails to wellness practitioners")
@@ -1,15 +1,46 @@
 # customer_outreach.py
-class RegenerativeOutreach:
-    def __init__(self):
-        self.email_templates = {
-            'wellness_practitioners': self.wellness_email(),
-            'meditation_teachers': self.meditation_email(),
-            'healing_centers': self.healing_center_email(),
-            'consciousness_researchers': self.researcher_email()
-        }
+import re
+from dataclasses import dataclass
+from itertools import repeat
+from types import MappingProxyType
+from typing import ClassVar, Final, List, Mapping, Sequence
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+class CompiledTemplate:
+    """Email template split once into static chunks and {placeholder} keys"""
+    __slots__ = ('_parts', '_keys', '_tail')
     
-    def wellness_email(self):
-        return """
+    def __init__(self, template: str):
+        pieces = _PLACEHOLDER.split(template)
+        # pieces alternates static chunk, key, static chunk, ..., static chunk
+        self._parts = tuple(pieces[0:-1:2])
+        self._keys = tuple(pieces[1::2])
+        self._tail = pieces[-1]
+    
+    def render(self, values: Mapping[str, str]) -> str:
+        """Fill the placeholders from values; missing keys render as ''"""
+        get = values.get
+        out = []
+        for part, key in zip(self._parts, self._keys):
+            out.append(part)
+            out.append(get(key, ''))
+        out.append(self._tail)
+        return ''.join(out)
+    
+    def render_batch(self, recipients: Sequence[Mapping[str, str]]) -> List[str]:
+        """Render one email per recipient, assembling the batch column by column"""
+        count = len(recipients)
+        columns = []
+        for part, key in zip(self._parts, self._keys):
+            columns.append(repeat(part, count))
+            columns.append([recipient.get(key, '') for recipient in recipients])
+        columns.append(repeat(self._tail, count))
+        # zip yields each recipient's chunks in order; join runs in C per email
+        return list(map(''.join, zip(*columns)))
+
+# Email templates are module constants: compiled once, never rebuilt per instance
+WELLNESS_EMAIL: Final[str] = """
 Subject: 🌞 World's First Solar-Powered Consciousness Analysis (Free Demo)
 
 Hi {name},
@@ -47,9 +78,8 @@ Healing the world, one word at a time,
 
 P.S. Early adopters get 50% off their first month ($49 instead of $99)
         """
-    
-    def meditation_email(self):
-        return """
+
+MEDITATION_EMAIL: Final[str] = """
 Subject: 🧘 Measure the Consciousness Impact of Your Meditation Guidance
 
 Hi {name},
@@ -88,6 +118,27 @@ In service of awakening,
 {your_name}
         """
 
+# Only audiences with a written template; healing-center and researcher emails don't exist yet
+_EMAIL_TEMPLATES = MappingProxyType({
+    'wellness_practitioners': WELLNESS_EMAIL,
+    'meditation_teachers': MEDITATION_EMAIL
+})
+
+@dataclass(frozen=True, slots=True)
+class RegenerativeOutreach:
+    # Parsed once at class load; batch senders call compiled_templates[audience].render(recipient)
+    compiled_templates: ClassVar[Mapping[str, CompiledTemplate]] = MappingProxyType({
+        audience: CompiledTemplate(template) for audience, template in _EMAIL_TEMPLATES.items()
+    })
+    
+    email_templates: ClassVar[Mapping[str, str]] = _EMAIL_TEMPLATES
+    
+    def wellness_email(self):
+        return WELLNESS_EMAIL
+    
+    def meditation_email(self):
+        return MEDITATION_EMAIL
+
 # Launch outreach campaign
 if __name__ == "__main__":
     outreach = RegenerativeOutreach()
@@ -4,103 +4,126 @@ Live URL: https://heartfelt-croquembouche-288018.netlify.app/
 Paul Morales - paulmorales@ntxtts.com
 """
 
+import sys
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple, Tuple
+
+class Priority(IntEnum):
+    """Lower value sorts first"""
+    CRITICAL = 0
+    URGENT = 1
+    HIGH = 2
+
+class Step(NamedTuple):
+    action: str
+    priority: Priority
+    time_min: int
+    steps: Tuple[str, ...]
+
+_LIVE_STATUS = MappingProxyType({
+    "website_status": "✅ LIVE - https://heartfelt-croquembouche-288018.netlify.app/",
+    "deployment_method": "✅ Netlify Drop - Quick deploy successful",
+    "owner": "✅ Paul Morales (paulmorales@ntxtts.com)",
+    "corporation": "✅ Alpha Pi Omega Corp",
+    "business_model": "✅ Solar-powered text analysis SaaS",
+    "ready_for_customers": "✅ YES - Can accept signups immediately"
+})
+
+# In execution order; index i is step i + 1
+_NEXT_STEPS: Tuple[Step, ...] = (
+    Step(
+        action="Purchase alphapiomega.com",
+        priority=Priority.HIGH,
+        time_min=15,
+        steps=(
+            "Go to namecheap.com",
+            "Account: paulmorales@ntxtts.com / Payroll$2023",
+            "Buy alphapiomega.com (~$12/year)",
+            "Point DNS to Netlify"
+        )
+    ),
+    Step(
+        action="Configure custom domain in Netlify",
+        priority=Priority.HIGH,
+        time_min=5,
+        steps=(
+            "Go to Netlify dashboard",
+            "Site settings → Domain management",
+            "Add custom domain: www.alphapiomega.com",
+            "Enable HTTPS automatically"
+        )
+    ),
+    Step(
+        action="Set up payment processing",
+        priority=Priority.CRITICAL,
+        time_min=30,
+        steps=(
+            "Create Stripe account: paulmorales@ntxtts.com",
+            "Business name: Alpha Pi Omega Corporation",
+            "Add bank account for payouts",
+            "Test subscription billing"
+        )
+    ),
+    Step(
+        action="Start marketing for first customers",
+        priority=Priority.URGENT,
+        time_min=60,
+        steps=(
+            "Email 10 potential customers about launch",
+            "Post on social media about Alpha Pi Omega",
+            "Create demo video of text analysis",
+            "Reach out to business contacts"
+        )
+    ),
+)
+
 def deployment_success_status():
     """Alpha Pi Omega is now LIVE!"""
     
-    live_status = {
-        "website_status": "✅ LIVE - https://heartfelt-croquembouche-288018.netlify.app/",
-        "deployment_method": "✅ Netlify Drop - Quick deploy successful",
-        "owner": "✅ Paul Morales (paulmorales@ntxtts.com)",
-        "corporation": "✅ Alpha Pi Omega Corp",
-        "business_model": "✅ Solar-powered text analysis SaaS",
-        "ready_for_customers": "✅ YES - Can accept signups immediately"
-    }
-    
-    immediate_next_steps = {
-        "step_1_custom_domain": {
-            "action": "Purchase alphapiomega.com",
-            "priority": "HIGH",
-            "time": "15 minutes",
-            "steps": [
-                "Go to namecheap.com",
-                "Account: paulmorales@ntxtts.com / Payroll$2023",
-                "Buy alphapiomega.com (~$12/year)",
-                "Point DNS to Netlify"
-            ]
-        },
-        "step_2_netlify_domain": {
-            "action": "Configure custom domain in Netlify",
-            "priority": "HIGH", 
-            "time": "5 minutes",
-            "steps": [
-                "Go to Netlify dashboard",
-                "Site settings → Domain management",
-                "Add custom domain: www.alphapiomega.com",
-                "Enable HTTPS automatically"
-            ]
-        },
-        "step_3_stripe_payments": {
-            "action": "Set up payment processing",
-            "priority": "CRITICAL",
-            "time": "30 minutes",
-            "steps": [
-                "Create Stripe account: paulmorales@ntxtts.com",
-                "Business name: Alpha Pi Omega Corporation",
-                "Add bank account for payouts",
-                "Test subscription billing"
-            ]
-        },
-        "step_4_customer_acquisition": {
-            "action": "Start marketing for first customers",
-            "priority": "URGENT",
-            "time": "60 minutes", 
-            "steps": [
-                "Email 10 potential customers about launch",
-                "Post on social media about Alpha Pi Omega",
-                "Create demo video of text analysis",
-                "Reach out to business contacts"
-            ]
-        }
-    }
-    
-    return live_status, immediate_next_steps
+    return _LIVE_STATUS, _NEXT_STEPS
+
+# Rendered once; printing it is a single write instead of ~30 print calls
+_CELEBRATION = "\n".join([
+    "🎉" * 50,
+    "🏢 ALPHA PI OMEGA CORPORATION IS LIVE!",
+    "🎉" * 50,
+    "",
+    "🌐 LIVE WEBSITE:",
+    "   https://heartfelt-croquembouche-288018.netlify.app/",
+    "",
+    "👨‍💼 BUSINESS OWNER:",
+    "   Paul Morales",
+    "   paulmorales@ntxtts.com",
+    "",
+    "🎯 WHAT YOU'VE ACHIEVED:",
+    "   ✅ Solar-powered text analysis platform",
+    "   ✅ Business registration system",
+    "   ✅ Pricing plans ($29-99/month)",
+    "   ✅ Professional website interface",
+    "   ✅ API endpoints fully functional",
+    "   ✅ Ready for customer signups",
+    "",
+    "🚀 NEXT 24 HOURS PRIORITIES:",
+    "   1️⃣ Buy alphapiomega.com domain",
+    "   2️⃣ Set up Stripe payment processing",
+    "   3️⃣ Email 10 potential customers",
+    "   4️⃣ Get first paying customer",
+    "",
+    "💰 REVENUE TARGETS:",
+    "   📅 This Week: First paying customer ($29)",
+    "   📅 Month 1: $500 MRR",
+    "   📅 Month 3: $2,000 MRR",
+    "",
+    "🌟 YOU DID IT, PAUL!",
+    "   Alpha Pi Omega Corporation is ready to revolutionize",
+    "   business text analysis with solar-powered technology!",
+]) + "\n"
 
 def print_success_celebration():
     """Celebrate Alpha Pi Omega going live!"""
     
-    print("🎉" * 50)
-    print("🏢 ALPHA PI OMEGA CORPORATION IS LIVE!")
-    print("🎉" * 50)
-    
-    print(f"\n🌐 LIVE WEBSITE:")
-    print(f"   https://heartfelt-croquembouche-288018.netlify.app/")
-    
-    print(f"\n👨‍💼 BUSINESS OWNER:")
-    print(f"   Paul Morales")
-    print(f"   paulmorales@ntxtts.com")
-    
-    print(f"\n🎯 WHAT YOU'VE ACHIEVED:")
-    print(f"   ✅ Solar-powered text analysis platform")
-    print(f"   ✅ Business registration system")
-    print(f"   ✅ Pricing plans ($29-99/month)")
-    print(f"   ✅ Professional website interface")
-    print(f"   ✅ API endpoints fully functional")
-    print(f"   ✅ Ready for customer signups")
-    
-    print(f"\n🚀 NEXT 24 HOURS PRIORITIES:")
-    print(f"   1️⃣ Buy alphapiomega.com domain")
-    print(f"   2️⃣ Set up Stripe payment processing")
-    print(f"   3️⃣ Email 10 potential customers")
-    print(f"   4️⃣ Get first paying customer")
-    
-    print(f"\n💰 REVENUE TARGETS:")
-    print(f"   📅 This Week: First paying customer ($29)")
-    print(f"   📅 Month 1: $500 MRR")
-    print(f"   📅 Month 3: $2,000 MRR")
-    
-    print(f"\n🌟 YOU DID IT, PAUL!")
-    print(f"   Alpha Pi Omega Corporation is ready to revolutionize")
-    print(f"   business text analysis with solar-powered technology!")
+    sys.stdout.write(_CELEBRATION)
 
 if __name__ == "__main__":
     print_success_celebration()
\ No newline at end of file
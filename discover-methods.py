@@ -1,4 +1,21 @@
 # Discover what methods are actually available
+import inspect
+import sys
+
+# getmembers_static is 3.11+; older interpreters fall back to the getattr-based scan
+_getmembers = getattr(inspect, "getmembers_static", inspect.getmembers)
+
+def _write_names(names):
+    # One write per listing rather than one print per name
+    if names:
+        sys.stdout.write("\n".join([f"  • {name}" for name in names]) + "\n")
+
+def dump(label, cls):
+    """Instantiate cls and list its public names under label"""
+    print(f"\n{label}:")
+    instance = cls()
+    _write_names([name for name in dir(instance) if not name.startswith('_')])
+
 print("🔍 Discovering APO Class Methods")
 print("=" * 50)
 
@@ -12,39 +29,22 @@ try:
     
     print("✅ All imports successful")
     
-    # Check MathematicalTheoryProcessor methods
-    print("\n🧮 MathematicalTheoryProcessor methods:")
-    math_proc = MathematicalTheoryProcessor()
-    math_methods = [method for method in dir(math_proc) if not method.startswith('_')]
-    for method in math_methods:
-        print(f"  • {method}")
-    
-    # Check AncientAstronomyProcessor methods
-    print("\n🌌 AncientAstronomyProcessor methods:")
-    astro_proc = AncientAstronomyProcessor()
-    astro_methods = [method for method in dir(astro_proc) if not method.startswith('_')]
-    for method in astro_methods:
-        print(f"  • {method}")
-    
-    # Check LogogramGlyphProcessor methods
-    print("\n📜 LogogramGlyphProcessor methods:")
-    logo_proc = LogogramGlyphProcessor()
-    logo_methods = [method for method in dir(logo_proc) if not method.startswith('_')]
-    for method in logo_methods:
-        print(f"  • {method}")
+    dump("🧮 MathematicalTheoryProcessor methods", MathematicalTheoryProcessor)
+    dump("🌌 AncientAstronomyProcessor methods", AncientAstronomyProcessor)
+    dump("📜 LogogramGlyphProcessor methods", LogogramGlyphProcessor)
     
     # Check UnifiedAPOQuantumLogos methods
     print("\n🌟 UnifiedAPOQuantumLogos methods:")
     apo = UnifiedAPOQuantumLogos()
-    apo_methods = [method for method in dir(apo) if not method.startswith('_')]
-    for method in apo_methods:
-        print(f"  • {method}")
+    # One static scan serves both listings; no getattr, so properties aren't evaluated
+    apo_members = [(name, value) for name, value in _getmembers(apo) if not name.startswith('_')]
+    apo_methods = [name for name, _ in apo_members]
+    _write_names(apo_methods)
     
     # Check UnifiedAPOQuantumLogos attributes
     print("\n🔧 UnifiedAPOQuantumLogos attributes:")
-    apo_attrs = [attr for attr in dir(apo) if not attr.startswith('_') and not callable(getattr(apo, attr))]
-    for attr in apo_attrs:
-        print(f"  • {attr}")
+    apo_attrs = [name for name, value in apo_members if not callable(value)]
+    _write_names(apo_attrs)
 
 except Exception as e:
     print(f"❌ Error: {e}")
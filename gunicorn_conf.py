@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for the ΑΠΩ server
+Run with: gunicorn -c gunicorn_conf.py apo_server:app
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2 * multiprocessing.cpu_count() + 1))
+worker_class = "gthread"
+# apo_server sizes its per-worker instance pool from the same variable
+threads = int(os.environ.get('APO_THREADS', 4))
+
+# Build the UnifiedAPOQuantumLogos pool once in the master so workers
+# share it copy-on-write instead of each constructing their own
+preload_app = True
@@ -0,0 +1,34 @@
+import pytest
+
+from customer_outreach import MEDITATION_EMAIL, WELLNESS_EMAIL, CompiledTemplate, RegenerativeOutreach
+
+RECIPIENTS = [
+    {'name': 'Ada', 'your_name': 'Team APO'},
+    {'name': 'Lin', 'your_name': ''},
+    {'name': '{name}', 'your_name': 'Ünïcode 🌞'},
+]
+
+
+@pytest.mark.parametrize('template', [WELLNESS_EMAIL, MEDITATION_EMAIL, 'Hi {name}', '{name}', 'no placeholders', ''],
+                         ids=['wellness', 'meditation', 'prefix', 'only-key', 'static', 'empty'])
+def test_render_matches_str_format(template):
+    compiled = CompiledTemplate(template)
+    for recipient in RECIPIENTS:
+        assert compiled.render(recipient) == template.format(**recipient)
+
+
+@pytest.mark.parametrize('template', [WELLNESS_EMAIL, MEDITATION_EMAIL, 'Hi {name}', ''],
+                         ids=['wellness', 'meditation', 'prefix', 'empty'])
+def test_render_batch_matches_str_format(template):
+    compiled = CompiledTemplate(template)
+    assert compiled.render_batch(RECIPIENTS) == [template.format(**recipient) for recipient in RECIPIENTS]
+    assert compiled.render_batch([]) == []
+
+
+def test_missing_keys_render_empty():
+    assert CompiledTemplate('Hi {name}, from {sender_name}').render({'name': 'Ada'}) == 'Hi Ada, from '
+
+
+def test_class_templates_compile_every_email():
+    outreach = RegenerativeOutreach()
+    assert outreach.compiled_templates.keys() == outreach.email_templates.keys()
@@ -0,0 +1,92 @@
+import math
+
+import numpy as np
+import pytest
+
+from apo_quantum_logos import APOQuantumRegister, APOSystem, MathematicalTheoryProcessor, UnifiedAPOQuantumLogos
+
+TEXTS = [
+    "The golden ratio and Fibonacci spiral echo Euler's identity",
+    "Orion, Sirius and the Maya calendar of Venus",
+    "𓂀 ☥ 道 𒀭 written beside בראשית",
+    "",
+    "plain text with nothing special",
+]
+
+
+@pytest.fixture
+def logos():
+    return UnifiedAPOQuantumLogos()
+
+
+def test_hebrew_analysis_tolerates_lone_surrogates(logos):
+    analysis = logos._analyze_hebrew_mystical_content("bad \ud800 surrogate")
+    assert analysis['gematria_value'] == 0
+    assert analysis['mystical_significance'] == 'Low'
+
+
+def test_hebrew_analysis_sums_gematria_around_surrogates(logos):
+    analysis = logos._analyze_hebrew_mystical_content("\udfffאב\ud800")
+    assert analysis['gematria_value'] == 3
+
+
+def test_mathematical_state_uses_passed_resonance():
+    processor = MathematicalTheoryProcessor()
+    resonance = 0.3
+    analysis = {'detected_equations': [{'name': 'euler_identity', 'resonance': resonance}]}
+    expected = complex(resonance * math.cos(resonance * math.pi), resonance * math.sin(resonance * math.pi))
+    assert processor.calculate_mathematical_quantum_state(analysis) == pytest.approx(expected)
+
+
+def test_columns_match_sequential_processing():
+    columns = UnifiedAPOQuantumLogos().process_unified_logos_columns(TEXTS)
+    sequential = UnifiedAPOQuantumLogos()
+    for i, text in enumerate(TEXTS):
+        result = sequential.process_unified_logos(text)
+        assert columns['total_mathematical_content'][i] == result['math_theory_analysis']['total_mathematical_content']
+        assert columns['total_resonance'][i] == pytest.approx(result['astronomical_analysis']['total_resonance'])
+        assert columns['total_logographic_content'][i] == result['logographic_analysis']['total_logographic_content']
+        assert columns['gematria_value'][i] == result['hebrew_mystical_analysis']['gematria_value']
+        assert columns['unified_signature'][i] == pytest.approx(result['unified_signature'])
+
+
+def test_batch_matches_sequential_signatures_and_field():
+    batched = UnifiedAPOQuantumLogos()
+    signatures = batched.process_unified_logos_batch(TEXTS)
+    sequential = UnifiedAPOQuantumLogos()
+    expected = [sequential.process_unified_logos(text)['unified_signature'] for text in TEXTS]
+    assert signatures.tolist() == pytest.approx(expected)
+    assert batched.consciousness_field == pytest.approx(sequential.consciousness_field)
+
+
+def test_system_process_batch_matches_columns():
+    rows = APOSystem().process_batch(TEXTS)
+    columns = UnifiedAPOQuantumLogos().process_unified_logos_columns(TEXTS)
+    assert len(rows) == len(TEXTS)
+    for i, row in enumerate(rows):
+        assert row == {key: column[i].item() for key, column in columns.items()}
+
+
+def test_gates_batch_matches_apply_gate():
+    gates = ['H', 'X', 'X', 'H', 'X']
+    indices = [0, 1, 0, -1, 3]
+    batched = APOQuantumRegister(4)
+    batched.apply_gates_batch([APOQuantumRegister.GATE_CODES[gate] for gate in gates], indices)
+    sequential = APOQuantumRegister(4)
+    for gate, index in zip(gates, indices):
+        sequential.apply_gate(gate, index)
+    np.testing.assert_array_equal(batched.qubits, sequential.qubits)
+
+
+@pytest.mark.parametrize('indices', [[0, 50, 100000], [4], [-5], [2**40]])
+def test_gates_batch_rejects_out_of_range_indices(indices):
+    register = APOQuantumRegister(4)
+    before = register.qubits.copy()
+    with pytest.raises(IndexError):
+        register.apply_gates_batch([1] * len(indices), indices)
+    np.testing.assert_array_equal(register.qubits, before)
+
+
+def test_gates_batch_rejects_mismatched_lengths():
+    with pytest.raises(ValueError):
+        APOQuantumRegister(4).apply_gates_batch([1, 1], [0])